@@ -344,12 +344,66 @@ class StereoCamera:
             self.logger.error(f"Failed to adjust focus for camera {camera_index}: {e}")
             return False
     
+    def adjust_focus_batch(self, steps: int, camera_index: int = 0) -> bool:
+        """
+        Apply several focus steps for specified camera in one driver call.
+        Args:
+            steps: signed number of steps to move (positive = increase)
+            camera_index: 0 for camera_0 (left), 1 for camera_1 (right)
+        Returns: success status (False if the step did not change)
+        """
+        if steps == 0:
+            return False
+
+        try:
+            with self._lock:
+                # Select the appropriate focus step variable
+                current_step = self.focus_step_0 if camera_index == 0 else self.focus_step_1
+                new_step = max(0, min(current_step + steps, self.focus_steps - 1))
+
+                # Check if step actually changed (boundary condition)
+                if new_step == current_step:
+                    self.logger.info(f"Focus at boundary for camera {camera_index}: step {current_step}")
+                    return False  # No change made
+
+                # Update the appropriate step variable
+                if camera_index == 0:
+                    self.focus_step_0 = new_step
+                else:
+                    self.focus_step_1 = new_step
+
+                # Convert discrete step to continuous range for camera API
+                lens_position = self.focus_range[0] + new_step * (self.focus_range[1] - self.focus_range[0]) / (self.focus_steps - 1)
+                focus_controls = {"LensPosition": int(lens_position)}
+
+                # Apply focus control if cameras are initialized
+                if self._initialized and Picamera2 and controls:
+                    try:
+                        camera = self.camera_0 if camera_index == 0 else self.camera_1
+                        camera.set_controls(focus_controls)
+                    except Exception as e:
+                        # Focus might not be available on all cameras
+                        self.logger.warning(f"Focus control not available on camera {camera_index}: {e}")
+                        pass
+
+                self.logger.info(f"Focus moved {steps:+d} step(s) for camera {camera_index}: step {new_step} (lens position: {int(lens_position)})")
+                return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to batch-adjust focus for camera {camera_index}: {e}")
+            return False
+
     def get_preview_frame(self, camera_index: int = 0) -> Optional[np.ndarray]:
         """
         Get a preview frame from specified camera.
         Args:
             camera_index: 0 for camera_0 (left), 1 for camera_1 (right)
         Returns: preview image as numpy array or None on failure.
+
+        Frames are RGB channel order (cameras are configured with the
+        RGB888 format and the preview resize goes through PIL, which is
+        RGB-native). UI consumers rely on this and build their QImages
+        with Format_RGB888 without any channel swap.
         """
         if not self._initialized:
             return None
@@ -383,6 +437,37 @@ class StereoCamera:
             self.logger.error(f"Failed to get preview frame from camera {camera_index}: {e}")
             return None
     
+    def fill_preview_frame(self, buffer: np.ndarray, camera_index: int = 0) -> bool:
+        """
+        Fill a caller-owned buffer with a preview frame in place.
+        Args:
+            buffer: preallocated (height, width, 3) uint8 array to fill
+            camera_index: 0 for camera_0 (left), 1 for camera_1 (right)
+        Returns: success status
+
+        Resizing straight into the caller's buffer avoids allocating a
+        fresh ndarray per preview tick. The channel order contract from
+        get_preview_frame applies here as well.
+        """
+        if not self._initialized:
+            return False
+            
+        try:
+            camera = self.camera_0 if camera_index == 0 else self.camera_1
+            
+            preview = camera.capture_array()
+            if preview is None:
+                return False
+            
+            img = Image.fromarray(preview)
+            img = img.resize((buffer.shape[1], buffer.shape[0]))
+            np.copyto(buffer, np.asarray(img))
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to fill preview frame from camera {camera_index}: {e}")
+            return False
+    
     def get_focus_step(self, camera_index: int = 0) -> int:
         """
         Get current focus step for specified camera.
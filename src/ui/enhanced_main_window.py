@@ -4,21 +4,23 @@ Implements the complete operator workflow with proper image review and file mana
 """
 
 import logging
+import time
 import numpy as np
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QLineEdit, QPushButton, QTextEdit, QProgressBar,
+    QLabel, QLineEdit, QPushButton, QPlainTextEdit, QProgressBar,
     QMessageBox, QDialog, QFrame, QSizePolicy, QCheckBox
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QThread
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPixmap, QImage, QFont, QPalette, QColor
 
 from ..camera import StereoCamera
 from ..storage import StorageManager
 from .preview_dialog import PreviewDialog
 from .focus_dialog import FocusDialog
+from .frame_broker import CameraFrameBroker
 
 
 class WorkflowState:
@@ -32,32 +34,6 @@ class WorkflowState:
     FOCUS_MODE = "focus_mode"
 
 
-class PreviewUpdateThread(QThread):
-    """Thread for updating camera preview without blocking UI."""
-    
-    frame_ready = Signal(np.ndarray)
-    
-    def __init__(self, camera: StereoCamera):
-        super().__init__()
-        self.camera = camera
-        self.running = False
-        
-    def run(self):
-        """Run preview update loop."""
-        self.running = True
-        while self.running:
-            if self.camera.is_initialized():
-                frame = self.camera.get_preview_frame()
-                if frame is not None:
-                    self.frame_ready.emit(frame)
-            self.msleep(100)  # 10 FPS preview
-            
-    def stop(self):
-        """Stop the preview thread."""
-        self.running = False
-        self.wait()
-
-
 class EnhancedMainWindow(QMainWindow):
     """
     Enhanced main application window implementing the complete stereo core camera workflow.
@@ -85,17 +61,24 @@ class EnhancedMainWindow(QMainWindow):
         self.captured_images: Optional[Tuple[np.ndarray, np.ndarray]] = None
         
         # UI components
-        self.preview_thread: Optional[PreviewUpdateThread] = None
+        self._preview_subscribed = False
         self.preview_dialog: Optional[PreviewDialog] = None
         self.focus_dialog: Optional[FocusDialog] = None
         
+        # Status/storage widget updates queued here are applied together
+        # under a single paint event; must exist before _start_preview
+        # logs its first status line
+        self._pending_widget_updates = []
+        self._ui_flush_scheduled = False
+
         self._setup_ui()
         self._setup_styling()
         self._setup_connections()
         self._start_preview()
         self._update_workflow_state()
-        
+
         # Storage monitoring timer
+        self._storage_state = None  # Last (text, style) applied to the indicator
         self.storage_timer = QTimer()
         self.storage_timer.timeout.connect(self._update_storage_info)
         self.storage_timer.start(10000)  # Update every 10 seconds
@@ -328,10 +311,12 @@ class EnhancedMainWindow(QMainWindow):
         status_header.addWidget(status_label)
         status_header.addWidget(self.storage_indicator)
         
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()
         self.status_text.setMaximumHeight(100)
         self.status_text.setReadOnly(True)
         self.status_text.setFont(QFont("Courier", 9))
+        # Bound the backlog so inserts stay O(1) regardless of history
+        self.status_text.setMaximumBlockCount(500)
         
         # Progress bar
         self.progress_bar = QProgressBar()
@@ -426,15 +411,22 @@ class EnhancedMainWindow(QMainWindow):
         self.depth_to_input.textChanged.connect(self._on_input_changed)
     
     def _start_preview(self):
-        """Start camera preview."""
+        """Start camera preview via the shared frame broker."""
         if self.camera.is_initialized():
-            self.preview_thread = PreviewUpdateThread(self.camera)
-            self.preview_thread.frame_ready.connect(self._update_preview)
-            self.preview_thread.start()
+            broker = CameraFrameBroker.instance(self.camera)
+            broker.subscribe(0, self._on_preview_frame)
+            self._preview_subscribed = True
             self._log_status("Live camera preview started")
         else:
             self._log_status("WARNING: Camera not initialized - running in development mode")
     
+    def _on_preview_frame(self, camera_index: int, seq: int, frame: np.ndarray):
+        """Receive a broker frame and repaint the main preview."""
+        # The broker multicasts every subscribed camera; the main
+        # preview only shows camera 0
+        if camera_index == 0:
+            self._update_preview(frame)
+    
     def _update_preview(self, frame: np.ndarray):
         """Update preview display with new frame."""
         try:
@@ -791,39 +783,63 @@ class EnhancedMainWindow(QMainWindow):
             warning_level = internal['warning_level']
             
             if warning_level == 'critical':
-                self.storage_indicator.setText("⚠️ Storage Critical")
-                self.storage_indicator.setStyleSheet("color: red; font-weight: bold;")
+                self._set_storage_indicator("⚠️ Storage Critical", "color: red; font-weight: bold;")
             elif warning_level == 'low':
-                self.storage_indicator.setText("⚠️ Storage Low")
-                self.storage_indicator.setStyleSheet("color: orange; font-weight: bold;")
+                self._set_storage_indicator("⚠️ Storage Low", "color: orange; font-weight: bold;")
             else:
                 usb_count = len(storage_info['usb_drives'])
                 if usb_count > 0:
-                    self.storage_indicator.setText("✓ Storage OK (USB)")
-                    self.storage_indicator.setStyleSheet("color: green;")
+                    self._set_storage_indicator("✓ Storage OK (USB)", "color: green;")
                 else:
-                    self.storage_indicator.setText("✓ Storage OK")
-                    self.storage_indicator.setStyleSheet("color: green;")
-                    
+                    self._set_storage_indicator("✓ Storage OK", "color: green;")
+
         except Exception as e:
             self.logger.error(f"Failed to update storage info: {e}")
-            self.storage_indicator.setText("Storage: Unknown")
-            self.storage_indicator.setStyleSheet("color: gray;")
+            self._set_storage_indicator("Storage: Unknown", "color: gray;")
+
+    def _set_storage_indicator(self, text: str, style: str):
+        """Update the storage indicator only when its state changed."""
+        state = (text, style)
+        if state == self._storage_state:
+            return
+        self._storage_state = state
+
+        def _apply():
+            self.storage_indicator.setText(text)
+            self.storage_indicator.setStyleSheet(style)
+
+        self._queue_widget_update(_apply)
+
+    def _queue_widget_update(self, callback):
+        """Queue a widget mutation for the next batched paint pass."""
+        self._pending_widget_updates.append(callback)
+        if not self._ui_flush_scheduled:
+            self._ui_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_ui_updates)
+
+    def _flush_ui_updates(self):
+        """Apply all queued widget updates under a single paint event."""
+        self._ui_flush_scheduled = False
+        updates, self._pending_widget_updates = self._pending_widget_updates, []
+        if not updates:
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            for update in updates:
+                update()
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _log_status(self, message: str):
         """Log status message to status display."""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         formatted_message = f"[{timestamp}] {message}"
-        
-        self.status_text.append(formatted_message)
+
+        # QPlainTextEdit auto-scrolls when the view is at the bottom,
+        # so no cursor manipulation is needed
+        self._queue_widget_update(
+            lambda: self.status_text.appendPlainText(formatted_message))
         self.logger.info(message)
-        
-        # Scroll to bottom
-        cursor = self.status_text.textCursor()
-        from PySide6.QtGui import QTextCursor
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.status_text.setTextCursor(cursor)
     
     def _show_error(self, message: str):
         """Show error message dialog."""
@@ -837,9 +853,11 @@ class EnhancedMainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle window close event."""
-        # Stop preview thread
-        if self.preview_thread:
-            self.preview_thread.stop()
+        # Stop preview delivery
+        if self._preview_subscribed:
+            broker = CameraFrameBroker.instance(self.camera)
+            broker.unsubscribe(0, self._on_preview_frame)
+            self._preview_subscribed = False
             
         # Stop timers
         if hasattr(self, 'storage_timer'):
@@ -9,8 +9,61 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QFrame, QSizePolicy, QButtonGroup
 )
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QPixmap, QImage, QFont
+from PySide6.QtCore import Qt, QTimer, QEvent
+from PySide6.QtGui import QPixmap, QFont
+
+from .frame_broker import CameraFrameBroker
+from ..utils.helpers import ndarray_to_qimage
+
+
+# Fonts shared by every dialog instance; constructed once at import so
+# reopening the dialog does not repeat font-database lookups
+_TITLE_FONT = QFont()
+_TITLE_FONT.setPointSize(16)
+_TITLE_FONT.setBold(True)
+_LABEL_FONT = QFont("Arial", 12, QFont.Bold)
+_BODY_FONT = QFont("Arial", 11)
+
+# Dialog stylesheet, built once at import so each dialog instance only
+# pays for Qt's parse, not for rebuilding the string
+_FOCUS_DIALOG_QSS = """
+    QDialog {
+        background-color: #f8f8f8;
+    }
+    QPushButton {
+        border: 2px solid #ddd;
+        border-radius: 8px;
+        padding: 8px;
+        font-size: 14px;
+        font-weight: bold;
+        background-color: #ffffff;
+    }
+    QPushButton:hover {
+        background-color: #e8e8e8;
+    }
+    QPushButton:pressed {
+        background-color: #d8d8d8;
+    }
+    QPushButton:checked {
+        background-color: #2196F3;
+        color: white;
+        border-color: #1976D2;
+    }
+    QPushButton#ok_button {
+        background-color: #4CAF50;
+        color: white;
+        border-color: #45a049;
+    }
+    QPushButton#cancel_button {
+        background-color: #f44336;
+        color: white;
+        border-color: #da190b;
+    }
+    QFrame {
+        background-color: white;
+        border-radius: 5px;
+    }
+"""
 
 
 class FocusDialog(QDialog):
@@ -18,7 +71,8 @@ class FocusDialog(QDialog):
     Dialog for adjusting camera focus with live preview.
     Shows live feed from cameras and allows focus adjustment.
     """
-    
+
+
     def __init__(self, parent=None, camera=None):
         super().__init__(parent)
         self.camera = camera
@@ -30,10 +84,32 @@ class FocusDialog(QDialog):
         
         # Current focus mode (0 = camera 1, 1 = camera 2)
         self.current_camera = 0
-        
-        # Live preview timer
-        self.preview_timer = QTimer()
-        self.preview_timer.timeout.connect(self._update_preview)
+
+        # Repaint coalescing state - only the most recent frame is painted,
+        # at most once per event-loop turn
+        self._latest_frame = None
+        self._needs_repaint = False
+        self._repaint_scheduled = False
+        self._current_frame = None  # Buffer backing the QImage being painted
+        self._painted_frame_seq = None  # Broker sequence of the last painted frame
+        self._latest_frame_seq = None
+
+        # Scaling cache - recomputed only when the label size or the
+        # incoming frame shape changes
+        self._last_label_size = None
+        self._last_frame_shape = None
+        self._scale_needed = True
+
+        # Whether this dialog is subscribed to the shared frame broker
+        self._subscribed = False
+
+        # Focus press batching - presses within a short window collapse
+        # into a single camera call
+        self._pending_focus_delta = 0
+        self._focus_flush_timer = QTimer(self)
+        self._focus_flush_timer.setSingleShot(True)
+        self._focus_flush_timer.setInterval(30)
+        self._focus_flush_timer.timeout.connect(self._flush_focus_adjustments)
         
         self._setup_ui()
         self._setup_styling()
@@ -48,10 +124,7 @@ class FocusDialog(QDialog):
         # Title
         title_label = QLabel("Focus Adjustment")
         title_label.setAlignment(Qt.AlignCenter)
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_TITLE_FONT)
         layout.addWidget(title_label)
         
         # Camera selection
@@ -73,7 +146,7 @@ class FocusDialog(QDialog):
         selection_layout = QHBoxLayout(selection_frame)
         
         selection_label = QLabel("Select Camera:")
-        selection_label.setFont(QFont("Arial", 12, QFont.Bold))
+        selection_label.setFont(_LABEL_FONT)
         selection_layout.addWidget(selection_label)
         
         # Camera selection buttons
@@ -90,7 +163,7 @@ class FocusDialog(QDialog):
         self.camera2_button.setMinimumSize(100, 40)
         self.camera_button_group.addButton(self.camera2_button, 1)
         
-        self.camera_button_group.buttonClicked.connect(self._on_camera_changed)
+        self.camera_button_group.idClicked.connect(self._on_camera_changed)
         
         selection_layout.addWidget(self.camera1_button)
         selection_layout.addWidget(self.camera2_button)
@@ -108,7 +181,7 @@ class FocusDialog(QDialog):
         # Preview title
         self.preview_title = QLabel("Live Preview - Camera 1")
         self.preview_title.setAlignment(Qt.AlignCenter)
-        self.preview_title.setFont(QFont("Arial", 12, QFont.Bold))
+        self.preview_title.setFont(_LABEL_FONT)
         preview_layout.addWidget(self.preview_title)
         
         # Preview display
@@ -137,7 +210,7 @@ class FocusDialog(QDialog):
         # Instructions
         instructions = QLabel("Use + and - buttons to adjust focus (8 discrete steps: 0-7)\nfor the selected camera")
         instructions.setAlignment(Qt.AlignCenter)
-        instructions.setFont(QFont("Arial", 11))
+        instructions.setFont(_BODY_FONT)
         controls_layout.addWidget(instructions)
         
         # Focus buttons
@@ -154,7 +227,7 @@ class FocusDialog(QDialog):
         # Focus status
         self.focus_status_label = QLabel("Focus Step: 3/7")
         self.focus_status_label.setAlignment(Qt.AlignCenter)
-        self.focus_status_label.setFont(QFont("Arial", 12, QFont.Bold))
+        self.focus_status_label.setFont(_LABEL_FONT)
         
         focus_button_layout.addWidget(self.focus_minus_button)
         focus_button_layout.addWidget(self.focus_status_label)
@@ -186,44 +259,7 @@ class FocusDialog(QDialog):
         
     def _setup_styling(self):
         """Set up dialog styling."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f8f8f8;
-            }
-            QPushButton {
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: 14px;
-                font-weight: bold;
-                background-color: #ffffff;
-            }
-            QPushButton:hover {
-                background-color: #e8e8e8;
-            }
-            QPushButton:pressed {
-                background-color: #d8d8d8;
-            }
-            QPushButton:checked {
-                background-color: #2196F3;
-                color: white;
-                border-color: #1976D2;
-            }
-            QPushButton#ok_button {
-                background-color: #4CAF50;
-                color: white;
-                border-color: #45a049;
-            }
-            QPushButton#cancel_button {
-                background-color: #f44336;
-                color: white;
-                border-color: #da190b;
-            }
-            QFrame {
-                background-color: white;
-                border-radius: 5px;
-            }
-        """)
+        self.setStyleSheet(_FOCUS_DIALOG_QSS)
         
         # Set object names for styling
         self.ok_button.setObjectName("ok_button")
@@ -232,7 +268,10 @@ class FocusDialog(QDialog):
     def _start_preview(self):
         """Start live preview update."""
         if self.camera and self.camera.is_initialized():
-            self.preview_timer.start(100)  # 10 FPS
+            if not self._subscribed:
+                broker = CameraFrameBroker.instance(self.camera)
+                broker.subscribe(self.current_camera, self._on_frame_ready)
+                self._subscribed = True
             # Initialize focus status display
             if hasattr(self.camera, 'get_focus_step'):
                 focus_step = self.camera.get_focus_step(self.current_camera)
@@ -241,51 +280,100 @@ class FocusDialog(QDialog):
             self.preview_label.setText("Camera not available\n(Running in development mode)")
             # Show default focus status for development mode
             self.focus_status_label.setText("Focus Step: 3/7 (Dev Mode)")
-            
+
     def _stop_preview(self):
         """Stop live preview update."""
-        if self.preview_timer.isActive():
-            self.preview_timer.stop()
-            
-    def _update_preview(self):
-        """Update live preview display."""
-        if not self.camera or not self.camera.is_initialized():
+        if self._subscribed:
+            broker = CameraFrameBroker.instance(self.camera)
+            broker.unsubscribe(self.current_camera, self._on_frame_ready)
+            self._subscribed = False
+
+    def _on_frame_ready(self, camera_index, seq, frame):
+        """Receive a preview frame from the broker and schedule a repaint."""
+        if camera_index != self.current_camera:
             return
-            
+
+        # Keep only the most recent frame and repaint at most once
+        # per event-loop turn, after pending events have drained
+        self._latest_frame = frame
+        self._latest_frame_seq = seq
+        self._needs_repaint = True
+        if not self._repaint_scheduled:
+            self._repaint_scheduled = True
+            QTimer.singleShot(0, self._do_repaint)
+
+    def _do_repaint(self):
+        """Repaint the preview from the most recent frame."""
+        self._repaint_scheduled = False
+        if not self._needs_repaint:
+            return
+        self._needs_repaint = False
+
+        frame = self._latest_frame
+        if frame is None:
+            return
+
+        # Skip all conversion and paint work if the broker has not
+        # produced a new frame since the last paint
+        if self._latest_frame_seq == self._painted_frame_seq:
+            return
+        self._painted_frame_seq = self._latest_frame_seq
+
         try:
-            # Get preview frame from selected camera
-            frame = self.camera.get_preview_frame(self.current_camera)
-            
-            if frame is not None:
-                # Convert numpy array to QImage
-                if len(frame.shape) == 3:
-                    height, width, channel = frame.shape
-                    bytes_per_line = 3 * width
-                    q_image = QImage(frame.data, width, height, bytes_per_line, QImage.Format_RGB888)
-                else:
-                    # Grayscale
-                    height, width = frame.shape
-                    bytes_per_line = width
-                    q_image = QImage(frame.data, width, height, bytes_per_line, QImage.Format_Grayscale8)
-                
-                # Convert to pixmap and scale
-                pixmap = QPixmap.fromImage(q_image)
-                scaled_pixmap = pixmap.scaled(
-                    self.preview_label.size(),
+            # Subsample in NumPy to at most 2x the label size so the Qt
+            # conversion and scaling work on a much smaller buffer
+            label_size = self.preview_label.size()
+            sy = max(1, frame.shape[0] // (2 * max(1, label_size.height())))
+            sx = max(1, frame.shape[1] // (2 * max(1, label_size.width())))
+            if sy > 1 or sx > 1:
+                # QImage needs a single contiguous stride
+                frame = np.ascontiguousarray(frame[::sy, ::sx])
+
+            # The QImage below shares this buffer rather than copying it,
+            # so the dialog must hold a reference until the next repaint
+            # overwrites it
+            self._current_frame = frame
+
+            # Convert numpy array to QImage
+            height, width = frame.shape[:2]
+            q_image = ndarray_to_qimage(frame)
+
+            # Decide whether scaling is needed at all; frames already
+            # within 10% of the label size are shown as-is
+            if label_size != self._last_label_size or frame.shape != self._last_frame_shape:
+                self._last_label_size = label_size
+                self._last_frame_shape = frame.shape
+                self._scale_needed = (
+                    abs(width - label_size.width()) > label_size.width() * 0.1 or
+                    abs(height - label_size.height()) > label_size.height() * 0.1
+                )
+
+            # Scale the QImage first so the pixmap conversion only
+            # processes the small result instead of the full frame
+            if self._scale_needed:
+                q_image = q_image.scaled(
+                    label_size,
                     Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
+                    Qt.FastTransformation
                 )
-                
-                self.preview_label.setPixmap(scaled_pixmap)
-            
+
+            self.preview_label.setPixmap(QPixmap.fromImage(q_image))
+
         except Exception as e:
-            self.logger.error(f"Failed to update focus preview: {e}")
+            self.logger.error(f"Failed to repaint focus preview: {e}")
             
-    def _on_camera_changed(self, button):
+    def _on_camera_changed(self, camera_id: int):
         """Handle camera selection change."""
-        self.current_camera = self.camera_button_group.id(button)
+        previous_camera = self.current_camera
+        self.current_camera = camera_id
         camera_name = "Camera 1" if self.current_camera == 0 else "Camera 2"
         self.preview_title.setText(f"Live Preview - {camera_name}")
+
+        # Move the broker subscription to the newly selected camera
+        if self._subscribed and previous_camera != camera_id:
+            broker = CameraFrameBroker.instance(self.camera)
+            broker.unsubscribe(previous_camera, self._on_frame_ready)
+            broker.subscribe(camera_id, self._on_frame_ready)
         
         # Update focus status for the selected camera
         if self.camera and hasattr(self.camera, 'get_focus_step'):
@@ -296,35 +384,39 @@ class FocusDialog(QDialog):
         
     def _on_focus_increase(self):
         """Handle focus increase button."""
-        if self.camera and hasattr(self.camera, 'adjust_focus'):
-            success = self.camera.adjust_focus("increase", self.current_camera)
-            if success:
-                # Update focus status
-                focus_step = self.camera.get_focus_step(self.current_camera)
-                self.focus_status_label.setText(f"Focus Step: {focus_step}/7")
-                self.logger.info(f"Focus increased for Camera {self.current_camera + 1} to step {focus_step}")
-            else:
-                # Update status anyway to show current value
-                focus_step = self.camera.get_focus_step(self.current_camera)
-                self.focus_status_label.setText(f"Focus Step: {focus_step}/7 (Max)")
-        else:
-            self.logger.info("Focus increase - Camera not available (development mode)")
-            
+        self._queue_focus_adjustment(1)
+
     def _on_focus_decrease(self):
         """Handle focus decrease button."""
-        if self.camera and hasattr(self.camera, 'adjust_focus'):
-            success = self.camera.adjust_focus("decrease", self.current_camera)
-            if success:
-                # Update focus status
-                focus_step = self.camera.get_focus_step(self.current_camera)
-                self.focus_status_label.setText(f"Focus Step: {focus_step}/7")
-                self.logger.info(f"Focus decreased for Camera {self.current_camera + 1} to step {focus_step}")
-            else:
-                # Update status anyway to show current value
-                focus_step = self.camera.get_focus_step(self.current_camera)
-                self.focus_status_label.setText(f"Focus Step: {focus_step}/7 (Min)")
+        self._queue_focus_adjustment(-1)
+
+    def _queue_focus_adjustment(self, delta: int):
+        """Accumulate focus presses and flush them as one camera call."""
+        if self.camera and hasattr(self.camera, 'adjust_focus_batch'):
+            self._pending_focus_delta += delta
+            if not self._focus_flush_timer.isActive():
+                self._focus_flush_timer.start()
         else:
-            self.logger.info("Focus decrease - Camera not available (development mode)")
+            direction = "increase" if delta > 0 else "decrease"
+            self.logger.info(f"Focus {direction} - Camera not available (development mode)")
+
+    def _flush_focus_adjustments(self):
+        """Apply all queued focus steps in a single camera call."""
+        delta = self._pending_focus_delta
+        self._pending_focus_delta = 0
+        if delta == 0:
+            return
+
+        success = self.camera.adjust_focus_batch(delta, self.current_camera)
+        focus_step = self.camera.get_focus_step(self.current_camera)
+        if success:
+            # Update focus status
+            self.focus_status_label.setText(f"Focus Step: {focus_step}/7")
+            self.logger.info(f"Focus moved {delta:+d} step(s) for Camera {self.current_camera + 1} to step {focus_step}")
+        else:
+            # Update status anyway to show current value
+            limit = "Max" if delta > 0 else "Min"
+            self.focus_status_label.setText(f"Focus Step: {focus_step}/7 ({limit})")
                 
     def exec(self):
         """Execute the dialog."""
@@ -334,7 +426,26 @@ class FocusDialog(QDialog):
         finally:
             self._stop_preview()
             
+    def showEvent(self, event):
+        """Resume the preview when the dialog becomes visible."""
+        super().showEvent(event)
+        self._start_preview()
+
+    def hideEvent(self, event):
+        """Pause the preview while the dialog is hidden."""
+        self._stop_preview()
+        super().hideEvent(event)
+
+    def changeEvent(self, event):
+        """Pause the preview while minimized, resume on restore."""
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self._stop_preview()
+            elif self.isVisible():
+                self._start_preview()
+        super().changeEvent(event)
+
     def closeEvent(self, event):
         """Handle dialog close."""
         self._stop_preview()
-        super().closeEvent(event) 
\ No newline at end of file
+        super().closeEvent(event)
\ No newline at end of file
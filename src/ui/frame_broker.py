@@ -0,0 +1,87 @@
+"""
+Shared camera frame broker for the Stereo Core Camera System UI.
+"""
+
+import logging
+import threading
+import numpy as np
+from PySide6.QtCore import Signal, QThread
+
+
+class CameraFrameBroker(QThread):
+    """
+    Process-wide camera grab loop shared by UI consumers.
+
+    Dialogs subscribe a slot for a camera index instead of each running
+    their own polling thread; a single background thread reads every
+    subscribed camera once per tick and multicasts the frame through a
+    queued signal, so additional consumers cost no extra camera reads.
+    """
+
+    frame_ready = Signal(int, int, np.ndarray)  # (camera_index, seq, frame)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls, camera=None):
+        """Return the process-wide broker, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls(camera)
+        return cls._instance
+
+    def __init__(self, camera):
+        super().__init__()
+        self.camera = camera
+        self.logger = logging.getLogger(__name__)
+        self.running = False
+
+        # Monotonic frame sequence number; consumers use it to tell a
+        # genuinely new frame from a redelivered one (object identity
+        # is unreliable once freed buffers get reallocated)
+        self._seq = 0
+
+        # Subscriber counts per camera index, guarded for cross-thread access
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, camera_index: int, slot) -> None:
+        """Start delivering frames for camera_index to the given slot."""
+        with self._lock:
+            self._subscribers[camera_index] = self._subscribers.get(camera_index, 0) + 1
+        self.frame_ready.connect(slot)
+        if not self.isRunning():
+            self.start()
+
+    def unsubscribe(self, camera_index: int, slot) -> None:
+        """Stop delivering frames for camera_index to the given slot."""
+        try:
+            self.frame_ready.disconnect(slot)
+        except (RuntimeError, TypeError):
+            pass  # Slot was not connected
+        with self._lock:
+            count = self._subscribers.get(camera_index, 0)
+            if count <= 1:
+                self._subscribers.pop(camera_index, None)
+            else:
+                self._subscribers[camera_index] = count - 1
+            idle = not self._subscribers
+        if idle and self.isRunning():
+            self.stop()
+
+    def run(self):
+        """Run the shared frame acquisition loop."""
+        self.running = True
+        while self.running:
+            with self._lock:
+                indices = list(self._subscribers)
+            for camera_index in indices:
+                frame = self.camera.get_preview_frame(camera_index)
+                if frame is not None:
+                    self._seq += 1
+                    self.frame_ready.emit(camera_index, self._seq, frame)
+            self.msleep(100)  # 10 FPS preview
+
+    def stop(self):
+        """Stop the broker thread."""
+        self.running = False
+        self.wait()
@@ -4,6 +4,7 @@ Optimized for 5-inch touchscreen operation.
 """
 
 import logging
+import time
 import numpy as np
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
@@ -12,43 +13,131 @@ from PySide6.QtWidgets import (
     QLabel, QLineEdit, QPushButton, QTextEdit, QProgressBar,
     QMessageBox, QDialog, QFrame, QSizePolicy, QApplication
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QThread
-from PySide6.QtGui import QPixmap, QImage, QFont, QPalette, QColor
+from PySide6.QtCore import Qt, QTimer, Signal, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QPixmap, QImage, QFont, QPalette, QColor, QGuiApplication
 
 from ..camera import StereoCamera
 from ..storage import StorageManager
+from ..utils.helpers import ndarray_to_qimage
 from .preview_dialog import PreviewDialog
 from .focus_dialog import FocusDialog
 
 
-class PreviewUpdateThread(QThread):
-    """Thread for updating camera preview without blocking UI."""
+# Application stylesheet, built once at import; Qt reparses QSS on every
+# setStyleSheet call, so per-button rules live here behind objectName
+# selectors instead of scattered per-widget setStyleSheet calls
+_MAIN_QSS = """
+    QMainWindow {
+        background-color: #f0f0f0;
+    }
+    QFrame {
+        background-color: white;
+        border-radius: 5px;
+        margin: 2px;
+    }
+    QLineEdit {
+        border: 2px solid #ddd;
+        border-radius: 5px;
+        padding: 5px;
+        font-size: 12px;
+    }
+    QLineEdit:focus {
+        border-color: #4CAF50;
+    }
+    QPushButton {
+        border: 2px solid #ddd;
+        border-radius: 5px;
+        padding: 5px;
+        background-color: #f9f9f9;
+    }
+    QPushButton:hover {
+        background-color: #e9e9e9;
+    }
+    QPushButton:pressed {
+        background-color: #d9d9d9;
+    }
+    QPushButton#okButton {
+        background-color: #4CAF50; color: white;
+        font-size: 14px; font-weight: bold;
+    }
+    QPushButton#noButton {
+        background-color: #f44336; color: white;
+        font-size: 14px; font-weight: bold;
+    }
+    QPushButton#plusButton, QPushButton#minusButton {
+        font-size: 16px; font-weight: bold;
+    }
+    QPushButton#brighterButton, QPushButton#darkerButton {
+        font-size: 12px;
+    }
+    QPushButton#focusButton {
+        font-size: 12px; background-color: #2196F3; color: white;
+    }
+"""
+
+
+class PreviewGrabSignals(QObject):
+    """Signal holder for preview grab tasks run on the thread pool."""
     
-    frame_ready = Signal(np.ndarray)
+    frame_ready = Signal(int)  # index into the preview buffer pool
+
+
+class PreviewGrabTask(QRunnable):
+    """One preview grab, executed on the global thread pool."""
     
-    def __init__(self, camera: StereoCamera):
+    def __init__(self, camera: StereoCamera, buffer: np.ndarray,
+                 buf_index: int, signals: PreviewGrabSignals, on_done):
         super().__init__()
         self.camera = camera
-        self.running = False
-        
+        self.buffer = buffer
+        self.buf_index = buf_index
+        self.signals = signals
+        self._on_done = on_done
+
     def run(self):
-        """Run preview update loop."""
-        self.running = True
-        while self.running:
-            if self.camera.is_initialized():
-                try:
-                    frame = self.camera.get_preview_frame()
-                    if frame is not None:
-                        self.frame_ready.emit(frame)
-                except Exception as e:
-                    # Log preview errors but don't stop thread
-                    pass
-            self.msleep(100)  # 10 FPS preview
-            
-    def stop(self):
-        """Stop the preview thread."""
-        self.running = False
-        self.wait()
+        """Fill the buffer and hand its pool index back to the GUI thread."""
+        try:
+            if self.camera.fill_preview_frame(self.buffer):
+                self.signals.frame_ready.emit(self.buf_index)
+        except Exception:
+            # Log preview errors but don't stop the preview
+            pass
+        finally:
+            self._on_done()
+
+
+class ImagePrepSignals(QObject):
+    """Signal holder for capture-preview preparation tasks."""
+    
+    image_ready = Signal(QImage)
+
+
+class ImagePrepTask(QRunnable):
+    """Decimate and scale a captured image off the GUI thread."""
+    
+    def __init__(self, image: np.ndarray, signals: ImagePrepSignals):
+        super().__init__()
+        self.image = image
+        self.signals = signals
+
+    def run(self):
+        """Prepare a dialog-sized QImage from the full-resolution capture."""
+        image = self.image
+        # Decimate by striding first; smooth-scaling a multi-megapixel
+        # buffer down to the dialog size is otherwise the dominant cost
+        step = max(1, max(image.shape[:2]) // 400)
+        if step > 1:
+            image = image[::step, ::step]
+        if not image.flags['C_CONTIGUOUS']:
+            # QImage requires contiguous rows (strided views are not)
+            image = np.ascontiguousarray(image)
+        
+        q_image = ndarray_to_qimage(image)
+        
+        # scaled() copies, so the emitted image owns its pixels and can
+        # safely outlive the numpy capture across the thread boundary
+        self.signals.image_ready.emit(
+            q_image.scaled(350, 250, Qt.KeepAspectRatio, Qt.SmoothTransformation))
 
 
 class MainWindow(QMainWindow):
@@ -71,16 +160,53 @@ class MainWindow(QMainWindow):
         self.current_depth_from = 0.0
         self.current_depth_to = 0.5
         
-        # Preview thread
-        self.preview_thread: Optional[PreviewUpdateThread] = None
+        # Preview grab state: the GUI timer submits one pool task per
+        # display tick, double-buffered, with at most one grab in flight
+        self._buffers = [np.empty((480, 640, 3), dtype=np.uint8) for _ in range(2)]
+        self._buf_idx = 0
+        self._grab_in_flight = False
+        self._preview_started = False
+        self._preview_signals = PreviewGrabSignals()
+        
+        # Persistent QImage views over the preview frame buffers
+        # (np.empty guarantees the C-contiguity the views rely on)
+        self._preview_qimages = [ndarray_to_qimage(buf) for buf in self._buffers]
         
         # Current captured images (for preview/review)
         self.captured_images: Optional[Tuple[np.ndarray, np.ndarray]] = None
         
+        # Status messages are batched and appended in one document edit
+        self._pending_log = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self._flush_status_log)
+        
+        # Debounce keystroke handling so typing does not parse the
+        # depth fields on every character
+        self._input_debounce_timer = QTimer(self)
+        self._input_debounce_timer.setSingleShot(True)
+        self._input_debounce_timer.setInterval(150)
+        self._input_debounce_timer.timeout.connect(self._apply_input_changes)
+        
         self._setup_ui()
         self._setup_styling()
         self._setup_connections()
         
+        # Cached preview scale target as plain ints, refreshed only
+        # when the window resizes
+        self._preview_w = self.preview_label.width()
+        self._preview_h = self.preview_label.height()
+        
+        # Preview grabs are scheduled from the GUI event loop at the
+        # display refresh rate; the event loop provides the pacing
+        screen = QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen is not None else 0.0
+        self._preview_timer = QTimer(self)
+        self._preview_timer.timeout.connect(self._schedule_preview_grab)
+        self._preview_timer.setInterval(
+            max(1, int(1000 / refresh_rate)) if refresh_rate > 0 else 16)
+        
         # Delay preview start to allow cameras to fully stabilize
         self.preview_start_timer = QTimer()
         self.preview_start_timer.timeout.connect(self._start_preview)
@@ -209,9 +335,6 @@ class MainWindow(QMainWindow):
         self.preview_label = QLabel()
         self.preview_label.setAlignment(Qt.AlignCenter)
         self.preview_label.setMinimumSize(320, 240)
-        self.preview_label.setStyleSheet(
-            "QLabel { background-color: black; border: 2px solid gray; }"
-        )
         self.preview_label.setText("Camera Preview\n(Initializing...)")
         self.preview_label.setStyleSheet(
             "QLabel { background-color: black; color: white; border: 2px solid gray; }"
@@ -231,11 +354,11 @@ class MainWindow(QMainWindow):
         
         self.ok_button = QPushButton("OK")
         self.ok_button.setMinimumSize(100, 60)
-        self.ok_button.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-size: 14px; font-weight: bold; }")
+        self.ok_button.setObjectName("okButton")
         
         self.no_button = QPushButton("NO")
         self.no_button.setMinimumSize(100, 60)
-        self.no_button.setStyleSheet("QPushButton { background-color: #f44336; color: white; font-size: 14px; font-weight: bold; }")
+        self.no_button.setObjectName("noButton")
         
         main_buttons_layout.addWidget(self.ok_button)
         main_buttons_layout.addWidget(self.no_button)
@@ -245,11 +368,11 @@ class MainWindow(QMainWindow):
         
         self.plus_button = QPushButton("+")
         self.plus_button.setMinimumSize(80, 50)
-        self.plus_button.setStyleSheet("QPushButton { font-size: 16px; font-weight: bold; }")
+        self.plus_button.setObjectName("plusButton")
         
         self.minus_button = QPushButton("−")
         self.minus_button.setMinimumSize(80, 50)
-        self.minus_button.setStyleSheet("QPushButton { font-size: 16px; font-weight: bold; }")
+        self.minus_button.setObjectName("minusButton")
         
         adjustment_layout.addWidget(self.plus_button)
         adjustment_layout.addWidget(self.minus_button)
@@ -259,11 +382,11 @@ class MainWindow(QMainWindow):
         
         self.brighter_button = QPushButton("BRIGHTER")
         self.brighter_button.setMinimumSize(100, 50)
-        self.brighter_button.setStyleSheet("QPushButton { font-size: 12px; }")
+        self.brighter_button.setObjectName("brighterButton")
         
         self.darker_button = QPushButton("DARKER")
         self.darker_button.setMinimumSize(100, 50)
-        self.darker_button.setStyleSheet("QPushButton { font-size: 12px; }")
+        self.darker_button.setObjectName("darkerButton")
         
         exposure_layout.addWidget(self.brighter_button)
         exposure_layout.addWidget(self.darker_button)
@@ -273,7 +396,7 @@ class MainWindow(QMainWindow):
         
         self.focus_button = QPushButton("FOCUS")
         self.focus_button.setMinimumSize(120, 50)
-        self.focus_button.setStyleSheet("QPushButton { font-size: 12px; background-color: #2196F3; color: white; }")
+        self.focus_button.setObjectName("focusButton")
         
         focus_layout.addWidget(self.focus_button)
         focus_layout.addStretch()
@@ -297,6 +420,8 @@ class MainWindow(QMainWindow):
         self.status_text.setMaximumHeight(100)
         self.status_text.setReadOnly(True)
         self.status_text.setFont(QFont("Courier", 9))
+        # Bound the backlog so appends stay O(1) over a full workday
+        self.status_text.document().setMaximumBlockCount(500)
         
         # Progress bar
         self.progress_bar = QProgressBar()
@@ -310,38 +435,8 @@ class MainWindow(QMainWindow):
         
     def _setup_styling(self):
         """Set up application styling."""
-        # Set overall application style
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f0f0f0;
-            }
-            QFrame {
-                background-color: white;
-                border-radius: 5px;
-                margin: 2px;
-            }
-            QLineEdit {
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                padding: 5px;
-                font-size: 12px;
-            }
-            QLineEdit:focus {
-                border-color: #4CAF50;
-            }
-            QPushButton {
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                padding: 5px;
-                background-color: #f9f9f9;
-            }
-            QPushButton:hover {
-                background-color: #e9e9e9;
-            }
-            QPushButton:pressed {
-                background-color: #d9d9d9;
-            }
-        """)
+        # Single module-level stylesheet parsed once per window
+        self.setStyleSheet(_MAIN_QSS)
         
     def _setup_connections(self):
         """Set up signal connections."""
@@ -370,9 +465,9 @@ class MainWindow(QMainWindow):
         """Start camera preview."""
         if self.camera.is_initialized():
             try:
-                self.preview_thread = PreviewUpdateThread(self.camera)
-                self.preview_thread.frame_ready.connect(self._update_preview)
-                self.preview_thread.start()
+                self._preview_signals.frame_ready.connect(self._update_preview)
+                self._preview_started = True
+                self._preview_timer.start()
                 self._log_status("Camera preview started")
             except Exception as e:
                 self.logger.error(f"Failed to start camera preview: {e}")
@@ -380,33 +475,67 @@ class MainWindow(QMainWindow):
         else:
             self._log_status("ERROR: Camera not initialized")
     
-    def _update_preview(self, frame: np.ndarray):
-        """Update preview display with new frame."""
+    def _schedule_preview_grab(self):
+        """Submit one preview grab to the thread pool, never more than
+        one outstanding so a slow capture cannot queue up work."""
+        if self._grab_in_flight or not self.camera.is_initialized():
+            return
+        self._grab_in_flight = True
+        buf_index = self._buf_idx
+        self._buf_idx = 1 - self._buf_idx
+        QThreadPool.globalInstance().start(
+            PreviewGrabTask(self.camera, self._buffers[buf_index], buf_index,
+                            self._preview_signals, self._grab_finished))
+    
+    def _grab_finished(self):
+        """Mark the in-flight grab as done (called from a pool thread)."""
+        self._grab_in_flight = False
+    
+    def _update_preview(self, buf_index: int):
+        """Update preview display with the frame in the given buffer."""
         try:
-            # Convert numpy array to QImage
-            if len(frame.shape) == 3:
-                height, width, channel = frame.shape
-                bytes_per_line = 3 * width
-                q_image = QImage(frame.data, width, height, bytes_per_line, QImage.Format_RGB888)
-            else:
-                # Grayscale
-                height, width = frame.shape
-                bytes_per_line = width
-                q_image = QImage(frame.data, width, height, bytes_per_line, QImage.Format_Grayscale8)
+            # Only the buffer's pool index crosses the thread boundary;
+            # the pixel data stays in place under its persistent QImage
+            q_image = self._preview_qimages[buf_index]
             
-            # Convert to pixmap and scale to fit label
-            pixmap = QPixmap.fromImage(q_image)
-            scaled_pixmap = pixmap.scaled(
-                self.preview_label.size(),
+            # Scale on the CPU first, then convert; fromImage on the
+            # full frame would push all of it to the window system only
+            # to discard most of the pixels in the scale
+            scaled_image = q_image.scaled(
+                self._preview_w, self._preview_h,
                 Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
+                Qt.FastTransformation
             )
             
-            self.preview_label.setPixmap(scaled_pixmap)
+            self.preview_label.setPixmap(QPixmap.fromImage(scaled_image))
             
         except Exception as e:
             self.logger.error(f"Failed to update preview: {e}")
     
+    def resizeEvent(self, event):
+        """Refresh the cached preview scale target on window resize."""
+        super().resizeEvent(event)
+        self._preview_w = self.preview_label.width()
+        self._preview_h = self.preview_label.height()
+    
+    def showEvent(self, event):
+        """Resume periodic work when the window becomes visible."""
+        super().showEvent(event)
+        # hasattr guards: _setup_ui can trigger showEvent before the
+        # timers exist when fullscreen is configured
+        if hasattr(self, 'storage_timer') and not self.storage_timer.isActive():
+            self.storage_timer.start(10000)
+        if getattr(self, '_preview_started', False) and not self._preview_timer.isActive():
+            self._preview_timer.start()
+    
+    def hideEvent(self, event):
+        """Stop periodic work while the window is hidden or minimized."""
+        super().hideEvent(event)
+        if hasattr(self, 'storage_timer'):
+            self.storage_timer.stop()
+        if hasattr(self, '_preview_timer'):
+            self._preview_timer.stop()
+    
     def _on_ok_clicked(self):
         """Handle OK button click."""
         if not self._validate_inputs():
@@ -438,32 +567,25 @@ class MainWindow(QMainWindow):
     
     def _show_image_preview(self, image: np.ndarray, title: str):
         """Show simple image preview and ask for confirmation."""
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QHBoxLayout
-        
         dialog = QDialog(self)
         dialog.setWindowTitle(f"Preview: {title}")
         dialog.resize(400, 350)
         
         layout = QVBoxLayout(dialog)
         
-        # Convert image to QPixmap
-        if len(image.shape) == 3:
-            height, width, channel = image.shape
-            bytes_per_line = 3 * width
-            q_image = QImage(image.data, width, height, bytes_per_line, QImage.Format_RGB888)
-        else:
-            height, width = image.shape
-            bytes_per_line = width
-            q_image = QImage(image.data, width, height, bytes_per_line, QImage.Format_Grayscale8)
-        
-        pixmap = QPixmap.fromImage(q_image)
-        
-        # Image label
-        image_label = QLabel()
-        image_label.setPixmap(pixmap.scaled(350, 250, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        # Image label; the heavy conversion and scaling run on the
+        # thread pool and land here via a queued signal (QPixmap is
+        # GUI-thread-only, so the worker ships a QImage instead)
+        image_label = QLabel("Preparing preview…")
         image_label.setAlignment(Qt.AlignCenter)
+        image_label.setMinimumSize(350, 250)
         layout.addWidget(image_label)
         
+        prep_signals = ImagePrepSignals()
+        prep_signals.image_ready.connect(
+            lambda img: image_label.setPixmap(QPixmap.fromImage(img)))
+        QThreadPool.globalInstance().start(ImagePrepTask(image, prep_signals))
+        
         # Buttons
         button_layout = QHBoxLayout()
         ok_btn = QPushButton("OK")
@@ -579,8 +701,6 @@ class MainWindow(QMainWindow):
     
     def _on_focus_clicked(self):
         """Handle FOCUS button click - simple focus adjustment."""
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QHBoxLayout
-        
         dialog = QDialog(self)
         dialog.setWindowTitle("Focus Adjustment")
         dialog.resize(300, 200)
@@ -610,8 +730,16 @@ class MainWindow(QMainWindow):
             self._log_status(f"Focus adjusted: {direction}")
     
     def _on_input_changed(self):
-        """Handle input field changes."""
-        self._update_current_values()
+        """Handle input field changes (debounced)."""
+        self._input_debounce_timer.start()
+    
+    def _apply_input_changes(self):
+        """Parse the input fields once typing has paused."""
+        try:
+            self._update_current_values()
+        except ValueError:
+            # Partial number mid-edit; keep the previous values
+            pass
     
     def _validate_inputs(self) -> bool:
         """Validate input fields."""
@@ -671,18 +799,20 @@ class MainWindow(QMainWindow):
     
     def _log_status(self, message: str):
         """Log status message to status display."""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
-        
-        self.status_text.append(formatted_message)
+        timestamp = time.strftime("%H:%M:%S")
+        self._pending_log.append(f"[{timestamp}] {message}")
         self.logger.info(message)
-        
-        # Scroll to bottom
-        cursor = self.status_text.textCursor()
-        from PySide6.QtGui import QTextCursor
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.status_text.setTextCursor(cursor)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_status_log(self):
+        """Append the pending status messages in one document edit."""
+        if not self._pending_log:
+            return
+        messages, self._pending_log = self._pending_log, []
+        # append auto-scrolls while the cursor sits at the end, so no
+        # explicit cursor move is needed
+        self.status_text.append("\n".join(messages))
     
     def _show_error(self, message: str):
         """Show error message dialog."""
@@ -696,9 +826,9 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle window close event."""
-        # Stop preview thread
-        if self.preview_thread:
-            self.preview_thread.stop()
+        # Stop preview grabs and let any in-flight task drain
+        self._preview_timer.stop()
+        QThreadPool.globalInstance().waitForDone(1000)
             
         # Stop timers
         if hasattr(self, 'storage_timer'):
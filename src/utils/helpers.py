@@ -2,12 +2,31 @@
 Utility helper functions for the Stereo Core Camera System.
 """
 
+import functools
 import logging
 import logging.handlers
 import os
+import platform
+import queue
 from pathlib import Path
 from typing import Dict, Any
 
+import numpy as np
+import psutil
+
+try:
+    from picamera2 import Picamera2
+except ImportError:
+    # For development on non-Pi systems
+    Picamera2 = None
+
+# Keeps the async logging listener alive (and stoppable on re-setup)
+_log_listener = None
+
+# Effective parameters of the last setup_logging call, so repeat calls
+# with an unchanged config don't tear down and reopen live handlers
+_log_signature = None
+
 
 def setup_logging(config: Dict[str, Any]) -> None:
     """
@@ -20,6 +39,14 @@ def setup_logging(config: Dict[str, Any]) -> None:
     log_file = log_config.get('file', '/tmp/stereo_camera.log')
     max_size_mb = log_config.get('max_size_mb', 10)
     
+    # Reconfiguring swaps handlers out from under concurrent emitters,
+    # briefly dropping records and reopening the log file — skip the
+    # whole dance when nothing has actually changed
+    global _log_listener, _log_signature
+    signature = (log_level, log_file, max_size_mb)
+    if signature == _log_signature and _log_listener is not None:
+        return
+    
     # Create log directory if it doesn't exist
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -28,7 +55,10 @@ def setup_logging(config: Dict[str, Any]) -> None:
     logger = logging.getLogger()
     logger.setLevel(log_level)
     
-    # Clear existing handlers
+    # Clear existing handlers (and any listener draining them)
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     
@@ -39,7 +69,6 @@ def setup_logging(config: Dict[str, Any]) -> None:
     )
     console_handler.setFormatter(console_formatter)
     console_handler.setLevel(log_level)
-    logger.addHandler(console_handler)
     
     # File handler with rotation
     file_handler = logging.handlers.RotatingFileHandler(
@@ -52,7 +81,17 @@ def setup_logging(config: Dict[str, Any]) -> None:
     )
     file_handler.setFormatter(file_formatter)
     file_handler.setLevel(log_level)
-    logger.addHandler(file_handler)
+    
+    # Emitting threads only enqueue records; the listener thread does
+    # the actual console/file writes, so SD-card latency and rotation
+    # never stall the camera or GUI loops
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    _log_signature = signature
     
     logger.info(f"Logging configured: level={log_level}, file={log_file}")
 
@@ -61,15 +100,16 @@ def create_directories(config: Dict[str, Any]) -> None:
     """
     Create necessary directories for the application.
     """
-    # Create internal storage directory
-    import os
     default_path = os.path.expanduser('~/core_photos')
     internal_path = config.get('storage', {}).get('internal_path', default_path)
-    Path(internal_path).mkdir(parents=True, exist_ok=True)
-    
-    # Create log directory
     log_file = config.get('logging', {}).get('file', '/tmp/stereo_camera.log')
-    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+    
+    # Internal storage and log directories; the set dedupes shared
+    # paths and the isdir check skips the per-parent stats mkdir
+    # performs when the tree already exists
+    for path in {internal_path, os.path.dirname(log_file) or '.'}:
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
     
     logging.info(f"Directories created: {internal_path}")
 
@@ -88,14 +128,45 @@ def format_file_size(size_bytes: int) -> str:
         return "0 B"
         
     size_names = ["B", "KB", "MB", "GB", "TB"]
-    import math
-    i = int(math.floor(math.log(size_bytes, 1024)))
-    p = math.pow(1024, i)
-    s = round(size_bytes / p, 2)
+    # bit_length is one CLZ-backed integer op and is exact at the 1024
+    # boundaries, unlike the float log it replaces
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(size_names) - 1)
+    s = round(size_bytes / (1 << (10 * i)), 2)
     
     return f"{s} {size_names[i]}"
 
 
+@functools.lru_cache(maxsize=1)
+def _get_static_system_info() -> Dict[str, Any]:
+    """
+    Collect system facts that cannot change while the process runs.
+    
+    Cached after the first call, so the /proc/cpuinfo scan and the
+    platform lookups run once per process.
+    """
+    info = {
+        'platform': platform.platform(),
+        'python_version': platform.python_version(),
+        'cpu_count': psutil.cpu_count(),
+    }
+    
+    # Check if we're on Raspberry Pi; the devicetree model file holds
+    # exactly the model string in a few NUL-terminated bytes, unlike
+    # /proc/cpuinfo which the kernel regenerates in full on every open
+    try:
+        with open('/sys/firmware/devicetree/base/model', 'rb') as f:
+            model = f.read().rstrip(b'\x00').decode()
+        if 'Raspberry Pi' in model:
+            info['is_raspberry_pi'] = True
+            info['pi_model'] = model
+        else:
+            info['is_raspberry_pi'] = False
+    except Exception:
+        info['is_raspberry_pi'] = False
+        
+    return info
+
+
 def get_system_info() -> Dict[str, Any]:
     """
     Get system information for debugging.
@@ -103,34 +174,14 @@ def get_system_info() -> Dict[str, Any]:
     Returns:
         Dictionary with system information
     """
-    import platform
-    import psutil
-    
     try:
-        info = {
-            'platform': platform.platform(),
-            'python_version': platform.python_version(),
-            'cpu_count': psutil.cpu_count(),
-            'memory_total': format_file_size(psutil.virtual_memory().total),
-            'memory_available': format_file_size(psutil.virtual_memory().available),
-        }
+        info = dict(_get_static_system_info())
+        
+        # One /proc/meminfo parse serves both memory fields
+        memory = psutil.virtual_memory()
+        info['memory_total'] = format_file_size(memory.total)
+        info['memory_available'] = format_file_size(memory.available)
         
-        # Check if we're on Raspberry Pi
-        try:
-            with open('/proc/cpuinfo', 'r') as f:
-                cpuinfo = f.read()
-                if 'Raspberry Pi' in cpuinfo:
-                    info['is_raspberry_pi'] = True
-                    # Extract Pi model
-                    for line in cpuinfo.split('\n'):
-                        if line.startswith('Model'):
-                            info['pi_model'] = line.split(':')[1].strip()
-                            break
-                else:
-                    info['is_raspberry_pi'] = False
-        except Exception:
-            info['is_raspberry_pi'] = False
-            
         return info
         
     except Exception as e:
@@ -138,6 +189,36 @@ def get_system_info() -> Dict[str, Any]:
         return {'error': str(e)}
 
 
+def ndarray_to_qimage(arr: np.ndarray):
+    """
+    Wrap a numpy array in a QImage without copying.
+    
+    Passes arr.strides[0] as bytes-per-line, so row-padded sub-images
+    display correctly as long as each row is contiguous. The returned
+    QImage borrows the buffer; the caller must keep the array alive for
+    the QImage's lifetime.
+    
+    Args:
+        arr: uint8 grayscale/RGB/RGBA or uint16 grayscale array
+        
+    Returns:
+        QImage sharing the array's memory
+    """
+    # Deferred so headless users of this module never touch Qt
+    from PySide6.QtGui import QImage
+    
+    if arr.ndim == 2:
+        fmt = (QImage.Format_Grayscale16 if arr.dtype == np.uint16
+               else QImage.Format_Grayscale8)
+    elif arr.shape[2] == 3:
+        fmt = QImage.Format_RGB888
+    elif arr.shape[2] == 4:
+        fmt = QImage.Format_RGBA8888
+    else:
+        raise ValueError(f"Unsupported number of channels: {arr.shape[2]}")
+    return QImage(arr.data, arr.shape[1], arr.shape[0], arr.strides[0], fmt)
+
+
 def validate_camera_hardware() -> Dict[str, Any]:
     """
     Validate camera hardware availability.
@@ -151,9 +232,9 @@ def validate_camera_hardware() -> Dict[str, Any]:
         'errors': []
     }
     
-    try:
-        # Check if picamera2 is available
-        from picamera2 import Picamera2
+    if Picamera2 is None:
+        results['errors'].append("Picamera2 not available")
+    else:
         results['picamera2_available'] = True
         
         # Try to detect cameras
@@ -168,8 +249,5 @@ def validate_camera_hardware() -> Dict[str, Any]:
                 
         except Exception as e:
             results['errors'].append(f"Camera detection failed: {e}")
-            
-    except ImportError as e:
-        results['errors'].append(f"Picamera2 not available: {e}")
         
     return results 
\ No newline at end of file
@@ -4,9 +4,23 @@ Tkinter UI demo for the Stereo Core Camera System.
 This version uses built-in tkinter and works on all Python installations.
 """
 
+import collections
+import functools
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime
+from tkinter import font as tkfont
+
+# Depth values advance in fixed steps, so the same few floats are
+# formatted over and over — memoize the 2-decimal rendering
+@functools.lru_cache(maxsize=4096)
+def _fmt2(x: float) -> str:
+    return f"{x:.2f}"
+
+
+# Lines kept in the status Text widget; older ones are trimmed so
+# inserts don't slow down as the buffer grows
+_MAX_LOG_LINES = 500
 
 
 class StereoCoreCameraDemo:
@@ -19,36 +33,71 @@ class StereoCoreCameraDemo:
         self.root.configure(bg='#f0f0f0')
         self.root.minsize(800, 700)
         
+        # Shared font objects: Tk caches metrics per Font instance, so
+        # reusing one object across widgets beats re-parsing a tuple
+        # per widget (and makes a future font change a one-liner)
+        self.fonts = {
+            'title': tkfont.Font(family='Arial', size=18, weight='bold'),
+            'section': tkfont.Font(family='Arial', size=14, weight='bold'),
+            'body': tkfont.Font(family='Arial', size=12),
+            'body_bold': tkfont.Font(family='Arial', size=12, weight='bold'),
+            'preview': tkfont.Font(family='Arial', size=11),
+            'btn_big': tkfont.Font(family='Arial', size=16, weight='bold'),
+            'btn_mid': tkfont.Font(family='Arial', size=14),
+            'mono': tkfont.Font(family='Courier', size=9),
+        }
+        
         # Current values
         self.current_depth_from = 0.0
         self.current_depth_to = 0.5
         
+        # Pending log lines, flushed in one batch at the next idle turn
+        self._log_queue = collections.deque()
+        self._log_pending = False
+        # Timestamp string cached per wall-clock second
+        self._last_ts_sec = -1
+        self._last_ts_str = ''
+        
+        # Focus dialog, built lazily on first use and then reshown
+        self._focus_window = None
+        
+        self._init_styles()
         self.setup_ui()
         # Don't log immediately - wait for UI to be ready
         self.root.after(100, lambda: self.log_status("UI Demo started - Mock mode"))
         
+    def _init_styles(self):
+        """Configure shared ttk button styles.
+
+        One style table replaces the per-widget color/relief/border
+        state blocks the classic tk.Button variants carried.
+        """
+        style = ttk.Style(self.root)
+        # The default theme ignores background overrides on buttons
+        style.theme_use('clam')
+        
+        button_styles = [
+            ('Ok.TButton', '#4CAF50', '#45a049', self.fonts['btn_big'], (12, 18)),
+            ('No.TButton', '#f44336', '#da190b', self.fonts['btn_big'], (12, 18)),
+            ('Adjust.TButton', '#2196F3', '#1976D2', self.fonts['title'], (12, 6)),
+            ('Brighter.TButton', '#FF9800', '#F57C00', self.fonts['body_bold'], (12, 6)),
+            ('Darker.TButton', '#795548', '#5D4037', self.fonts['body_bold'], (12, 6)),
+            ('Focus.TButton', '#9C27B0', '#7B1FA2', self.fonts['section'], (12, 6)),
+        ]
+        for name, bg, active_bg, font, padding in button_styles:
+            style.configure(name, background=bg, foreground='white',
+                            font=font, padding=padding, relief=tk.RAISED,
+                            borderwidth=3)
+            style.map(name,
+                      background=[('active', active_bg)],
+                      foreground=[('active', 'white')])
+        
     def setup_ui(self):
         """Set up the user interface."""
-        # Main container with scrollable canvas
-        canvas = tk.Canvas(self.root, bg='#f0f0f0')
-        scrollbar = tk.Scrollbar(self.root, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#f0f0f0')
-        
-        # Configure scrolling
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Main content frame
-        main_frame = tk.Frame(scrollable_frame, bg='#f0f0f0', padx=20, pady=20)
+        # Main content frame, packed straight on the root: everything
+        # fits within the 800x700 minimum size, so the old scrollable
+        # canvas wrapper only added reflow work on every resize
+        main_frame = tk.Frame(self.root, bg='#f0f0f0', padx=20, pady=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Header
@@ -74,7 +123,7 @@ class StereoCoreCameraDemo:
         title_label = tk.Label(
             header_frame, 
             text="Stereo Core Camera System",
-            font=('Arial', 18, 'bold'),
+            font=self.fonts['title'],
             bg='white',
             fg='#333',
             pady=15
@@ -87,50 +136,58 @@ class StereoCoreCameraDemo:
         input_frame.pack(fill=tk.X, pady=(0, 15))
         
         # Title
-        title_label = tk.Label(input_frame, text="Project Information", font=('Arial', 14, 'bold'), bg='white', fg='#333')
+        title_label = tk.Label(input_frame, text="Project Information", font=self.fonts['section'], bg='white', fg='#333')
         title_label.pack(pady=(15, 10))
         
         # Input container
         container = tk.Frame(input_frame, bg='white')
         container.pack(fill=tk.X, padx=20, pady=(0, 15))
         
-        # Project name
-        proj_frame = tk.Frame(container, bg='white')
-        proj_frame.pack(fill=tk.X, pady=5)
-        tk.Label(proj_frame, text="Project Name:", font=('Arial', 12), bg='white', fg='#555').pack(anchor='w')
-        self.project_var = tk.StringVar()
-        self.project_entry = tk.Entry(proj_frame, textvariable=self.project_var, font=('Arial', 12), width=40, relief=tk.SOLID, bd=1)
-        self.project_entry.pack(fill=tk.X, pady=(2, 0))
-        self.project_entry.insert(0, "TestProject")
-        
-        # Borehole name
-        bore_frame = tk.Frame(container, bg='white')
-        bore_frame.pack(fill=tk.X, pady=5)
-        tk.Label(bore_frame, text="Borehole Name:", font=('Arial', 12), bg='white', fg='#555').pack(anchor='w')
-        self.borehole_var = tk.StringVar()
-        self.borehole_entry = tk.Entry(bore_frame, textvariable=self.borehole_var, font=('Arial', 12), width=40, relief=tk.SOLID, bd=1)
-        self.borehole_entry.pack(fill=tk.X, pady=(2, 0))
-        self.borehole_entry.insert(0, "BH-001")
+        # Full-width fields: (attribute stem, label, initial value)
+        for name, label, initial in [
+            ('project', "Project Name:", "TestProject"),
+            ('borehole', "Borehole Name:", "BH-001"),
+        ]:
+            frame = tk.Frame(container, bg='white')
+            frame.pack(fill=tk.X, pady=5)
+            var, entry = self._make_entry(frame, label, initial, width=40)
+            setattr(self, f"{name}_var", var)
+            setattr(self, f"{name}_entry", entry)
         
         # Depth fields in horizontal layout
         depth_frame = tk.Frame(container, bg='white')
         depth_frame.pack(fill=tk.X, pady=5)
-        
-        # Left side - Depth From
-        left_frame = tk.Frame(depth_frame, bg='white')
-        left_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
-        tk.Label(left_frame, text="Depth From (m):", font=('Arial', 12), bg='white', fg='#555').pack(anchor='w')
-        self.depth_from_var = tk.StringVar(value="0.00")
-        self.depth_from_entry = tk.Entry(left_frame, textvariable=self.depth_from_var, font=('Arial', 12), relief=tk.SOLID, bd=1)
-        self.depth_from_entry.pack(fill=tk.X, pady=(2, 0))
-        
-        # Right side - Depth To
-        right_frame = tk.Frame(depth_frame, bg='white')
-        right_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        tk.Label(right_frame, text="Depth To (m):", font=('Arial', 12), bg='white', fg='#555').pack(anchor='w')
-        self.depth_to_var = tk.StringVar(value="0.50")
-        self.depth_to_entry = tk.Entry(right_frame, textvariable=self.depth_to_var, font=('Arial', 12), relief=tk.SOLID, bd=1)
-        self.depth_to_entry.pack(fill=tk.X, pady=(2, 0))
+        for name, label, initial, padx in [
+            ('depth_from', "Depth From (m):", "0.00", (0, 10)),
+            ('depth_to', "Depth To (m):", "0.50", 0),
+        ]:
+            frame = tk.Frame(depth_frame, bg='white')
+            frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=padx)
+            var, entry = self._make_entry(frame, label, initial)
+            setattr(self, f"{name}_var", var)
+            setattr(self, f"{name}_entry", entry)
+        
+        # Typed edits must resync the numeric cache the +/- handlers
+        # step, or they would snap the field back to a stale value
+        self.depth_to_entry.bind('<FocusOut>', self._sync_depth_to)
+        self.depth_to_entry.bind('<Return>', self._sync_depth_to)
+        
+    def _sync_depth_to(self, event=None):
+        """Re-parse a hand-edited Depth To into the numeric cache."""
+        try:
+            self.current_depth_to = float(self.depth_to_var.get())
+        except ValueError:
+            pass  # Keep the last good value; +/- will rewrite the field
+        
+    def _make_entry(self, parent, label, initial, width=None):
+        """Create one labelled Entry and return its (StringVar, Entry)."""
+        tk.Label(parent, text=label, font=self.fonts['body'], bg='white', fg='#555').pack(anchor='w')
+        var = tk.StringVar(value=initial)
+        kwargs = {'width': width} if width else {}
+        entry = tk.Entry(parent, textvariable=var, font=self.fonts['body'],
+                         relief=tk.SOLID, bd=1, **kwargs)
+        entry.pack(fill=tk.X, pady=(2, 0))
+        return var, entry
         
     def create_preview_section(self, parent):
         """Create camera preview section."""
@@ -138,14 +195,14 @@ class StereoCoreCameraDemo:
         preview_frame.pack(fill=tk.X, pady=(0, 15))
         
         # Title
-        title_label = tk.Label(preview_frame, text="Camera Preview", font=('Arial', 14, 'bold'), bg='white', fg='#333')
+        title_label = tk.Label(preview_frame, text="Camera Preview", font=self.fonts['section'], bg='white', fg='#333')
         title_label.pack(pady=(15, 10))
         
         # Preview area
         self.preview_label = tk.Label(
             preview_frame,
             text="📷 Camera Preview\n(Mock Mode - Demo)\n\nThis would show live camera feed\nfrom dual IMX219 cameras\n\nResolution: 3280x2464\nStereo Pair Setup",
-            font=('Arial', 11),
+            font=self.fonts['preview'],
             bg='#2a2a2a',
             fg='white',
             width=60,
@@ -155,6 +212,21 @@ class StereoCoreCameraDemo:
             justify=tk.CENTER
         )
         self.preview_label.pack(pady=(0, 15))
+        self._preview_default_text = self.preview_label.cget("text")
+        
+        # Inline accept/reject prompt, hidden until a capture preview
+        # needs a decision; non-modal so after() callbacks keep running
+        self._prompt_stage = 0
+        self._prompt_frame = tk.Frame(preview_frame, bg='white')
+        self._prompt_label = tk.Label(self._prompt_frame, text="Accept this image?",
+                                      font=self.fonts['body'], bg='white', fg='#333')
+        self._prompt_label.pack(pady=(0, 5))
+        prompt_btn_frame = tk.Frame(self._prompt_frame, bg='white')
+        prompt_btn_frame.pack()
+        ttk.Button(prompt_btn_frame, text="Accept", style='Ok.TButton', width=10,
+                   command=self._on_prompt_accept).pack(side=tk.LEFT, padx=(0, 15))
+        ttk.Button(prompt_btn_frame, text="Reject", style='No.TButton', width=10,
+                   command=self._on_prompt_reject).pack(side=tk.LEFT)
         
     def create_control_buttons(self, parent):
         """Create control buttons section."""
@@ -162,136 +234,30 @@ class StereoCoreCameraDemo:
         controls_frame.pack(fill=tk.X, pady=(0, 15))
         
         # Title
-        title_label = tk.Label(controls_frame, text="Controls", font=('Arial', 14, 'bold'), bg='white', fg='#333')
+        title_label = tk.Label(controls_frame, text="Controls", font=self.fonts['section'], bg='white', fg='#333')
         title_label.pack(pady=(15, 10))
         
-        # Main action buttons
-        main_btn_frame = tk.Frame(controls_frame, bg='white')
-        main_btn_frame.pack(pady=10)
-        
-        self.ok_button = tk.Button(
-            main_btn_frame,
-            text="OK",
-            font=('Arial', 16, 'bold'),
-            bg='#4CAF50',
-            fg='white',
-            width=12,
-            height=2,
-            relief=tk.RAISED,
-            bd=3,
-            activebackground='#45a049',
-            activeforeground='white',
-            command=self.on_ok_clicked
-        )
-        self.ok_button.pack(side=tk.LEFT, padx=(0, 15))
-        
-        self.no_button = tk.Button(
-            main_btn_frame,
-            text="NO",
-            font=('Arial', 16, 'bold'),
-            bg='#f44336',
-            fg='white',
-            width=12,
-            height=2,
-            relief=tk.RAISED,
-            bd=3,
-            activebackground='#da190b',
-            activeforeground='white',
-            command=self.on_no_clicked
-        )
-        self.no_button.pack(side=tk.LEFT)
-        
-        # Adjustment buttons
-        adj_btn_frame = tk.Frame(controls_frame, bg='white')
-        adj_btn_frame.pack(pady=8)
-        
-        self.plus_button = tk.Button(
-            adj_btn_frame,
-            text="+",
-            font=('Arial', 18, 'bold'),
-            bg='#2196F3',
-            fg='white',
-            width=8,
-            height=1,
-            relief=tk.RAISED,
-            bd=3,
-            activebackground='#1976D2',
-            activeforeground='white',
-            command=self.on_plus_clicked
-        )
-        self.plus_button.pack(side=tk.LEFT, padx=(0, 15))
-        
-        self.minus_button = tk.Button(
-            adj_btn_frame,
-            text="−",
-            font=('Arial', 18, 'bold'),
-            bg='#2196F3',
-            fg='white',
-            width=8,
-            height=1,
-            relief=tk.RAISED,
-            bd=3,
-            activebackground='#1976D2',
-            activeforeground='white',
-            command=self.on_minus_clicked
-        )
-        self.minus_button.pack(side=tk.LEFT)
-        
-        # Exposure buttons
-        exp_btn_frame = tk.Frame(controls_frame, bg='white')
-        exp_btn_frame.pack(pady=8)
-        
-        self.brighter_button = tk.Button(
-            exp_btn_frame,
-            text="BRIGHTER",
-            font=('Arial', 12, 'bold'),
-            bg='#FF9800',
-            fg='white',
-            width=14,
-            height=1,
-            relief=tk.RAISED,
-            bd=3,
-            activebackground='#F57C00',
-            activeforeground='white',
-            command=self.on_brighter_clicked
-        )
-        self.brighter_button.pack(side=tk.LEFT, padx=(0, 15))
-        
-        self.darker_button = tk.Button(
-            exp_btn_frame,
-            text="DARKER",
-            font=('Arial', 12, 'bold'),
-            bg='#795548',
-            fg='white',
-            width=14,
-            height=1,
-            relief=tk.RAISED,
-            bd=3,
-            activebackground='#5D4037',
-            activeforeground='white',
-            command=self.on_darker_clicked
-        )
-        self.darker_button.pack(side=tk.LEFT)
-        
-        # Focus button
-        focus_btn_frame = tk.Frame(controls_frame, bg='white')
-        focus_btn_frame.pack(pady=(8, 15))
-        
-        self.focus_button = tk.Button(
-            focus_btn_frame,
-            text="FOCUS",
-            font=('Arial', 14, 'bold'),
-            bg='#9C27B0',
-            fg='white',
-            width=18,
-            height=1,
-            relief=tk.RAISED,
-            bd=3,
-            activebackground='#7B1FA2',
-            activeforeground='white',
-            command=self.on_focus_clicked
-        )
-        self.focus_button.pack()
+        # One row per button group: (row pady, [(attribute stem,
+        # text, style, width, command), ...]); the loop below replaces
+        # seven near-identical construction blocks
+        button_rows = [
+            (10, [('ok', "OK", 'Ok.TButton', 12, self.on_ok_clicked),
+                  ('no', "NO", 'No.TButton', 12, self.on_no_clicked)]),
+            (8, [('plus', "+", 'Adjust.TButton', 8, self.on_plus_clicked),
+                 ('minus', "−", 'Adjust.TButton', 8, self.on_minus_clicked)]),
+            (8, [('brighter', "BRIGHTER", 'Brighter.TButton', 14, self.on_brighter_clicked),
+                 ('darker', "DARKER", 'Darker.TButton', 14, self.on_darker_clicked)]),
+            ((8, 15), [('focus', "FOCUS", 'Focus.TButton', 18, self.on_focus_clicked)]),
+        ]
+        for pady, specs in button_rows:
+            row_frame = tk.Frame(controls_frame, bg='white')
+            row_frame.pack(pady=pady)
+            for i, (name, text, style, width, command) in enumerate(specs):
+                button = ttk.Button(row_frame, text=text, style=style,
+                                    width=width, command=command)
+                button.pack(side=tk.LEFT,
+                            padx=(0, 15) if i < len(specs) - 1 else 0)
+                setattr(self, f"{name}_button", button)
         
     def create_status_section(self, parent):
         """Create status section."""
@@ -299,7 +265,7 @@ class StereoCoreCameraDemo:
         status_frame.pack(fill=tk.BOTH, expand=True)
         
         # Title
-        tk.Label(status_frame, text="System Status", font=('Arial', 12, 'bold'), bg='white').pack(pady=(10, 5))
+        tk.Label(status_frame, text="System Status", font=self.fonts['body_bold'], bg='white').pack(pady=(10, 5))
         
         # Status text area
         text_frame = tk.Frame(status_frame, bg='white')
@@ -308,7 +274,7 @@ class StereoCoreCameraDemo:
         self.status_text = tk.Text(
             text_frame,
             height=6,
-            font=('Courier', 9),
+            font=self.fonts['mono'],
             bg='#f8f8f8',
             wrap=tk.WORD
         )
@@ -329,17 +295,23 @@ class StereoCoreCameraDemo:
             maximum=100,
             length=300
         )
+        self._progress_visible = False
         
     def show_progress(self, value):
         """Show progress bar with value."""
-        self.progress_frame.pack(pady=5)
-        self.progress_bar.pack()
+        if not self._progress_visible:
+            self.progress_frame.pack(pady=5)
+            self.progress_bar.pack()
+            self._progress_visible = True
         self.progress_var.set(value)
-        self.root.update()
+        # Flush only pending redraws; update() would reenter the whole
+        # event loop just to repaint one bar
+        self.root.update_idletasks()
         
     def hide_progress(self):
         """Hide progress bar."""
         self.progress_frame.pack_forget()
+        self._progress_visible = False
         
     def on_ok_clicked(self):
         """Handle OK button click."""
@@ -361,32 +333,43 @@ class StereoCoreCameraDemo:
         self.root.after(1000, self.show_camera1_preview)
         
     def show_camera1_preview(self):
-        """Show Camera 1 preview dialog."""
+        """Show the Camera 1 preview with its inline prompt."""
         self.hide_progress()
-        
-        result = messagebox.askyesno(
-            "Preview: Camera 1",
-            "📷 Camera 1 Image\n(Simulated Capture)\n\nThis would show the actual photo from left camera.\n\nAccept this image?",
-            icon='question'
-        )
-        
-        if result:
-            self.show_camera2_preview()
-        else:
-            self.log_status("❌ Camera 1 image rejected")
+        self._show_inline_prompt(1)
             
     def show_camera2_preview(self):
-        """Show Camera 2 preview dialog."""
-        result = messagebox.askyesno(
-            "Preview: Camera 2", 
-            "📷 Camera 2 Image\n(Simulated Capture)\n\nThis would show the actual photo from right camera.\n\nAccept this image?",
-            icon='question'
+        """Show the Camera 2 preview with its inline prompt."""
+        self._show_inline_prompt(2)
+        
+    def _show_inline_prompt(self, stage):
+        """Swap the preview to the given capture and show accept/reject."""
+        side = "left" if stage == 1 else "right"
+        self.preview_label.configure(
+            text=f"📷 Camera {stage} Image\n(Simulated Capture)\n\n"
+                 f"This would show the actual photo from {side} camera."
         )
-        
-        if result:
-            self.simulate_save()
+        self._prompt_stage = stage
+        self._prompt_frame.pack(pady=(0, 15))
+        
+    def _hide_inline_prompt(self):
+        """Hide the prompt and restore the idle preview text."""
+        self._prompt_frame.pack_forget()
+        self._prompt_stage = 0
+        self.preview_label.configure(text=self._preview_default_text)
+        
+    def _on_prompt_accept(self):
+        """Advance the capture workflow for the accepted image."""
+        stage = self._prompt_stage
+        if stage == 1:
+            self.show_camera2_preview()
         else:
-            self.log_status("❌ Camera 2 image rejected")
+            self._hide_inline_prompt()
+            self.simulate_save()
+        
+    def _on_prompt_reject(self):
+        """Abort the capture workflow for the rejected image."""
+        self.log_status(f"❌ Camera {self._prompt_stage} image rejected")
+        self._hide_inline_prompt()
             
     def simulate_save(self):
         """Simulate saving images and advancing."""
@@ -395,20 +378,24 @@ class StereoCoreCameraDemo:
         depth_from = self.current_depth_from
         depth_to = self.current_depth_to
         
-        filename = f"{project}/{borehole}/{borehole}-{depth_from:.2f}-{depth_to:.2f}"
+        df = _fmt2(depth_from)
+        dt = _fmt2(depth_to)
+        filename = f"{project}/{borehole}/{borehole}-{df}-{dt}"
         self.log_status(f"💾 Saved: {filename}-1.jpg and {filename}-2.jpg")
         self.log_status("✅ Images saved successfully!")
         
         # Auto-advance to next segment
         new_from = depth_to
         new_to = new_from + 0.5
+        nf = _fmt2(new_from)
+        nt = _fmt2(new_to)
         
-        self.depth_from_var.set(f"{new_from:.2f}")
-        self.depth_to_var.set(f"{new_to:.2f}")
+        self.depth_from_var.set(nf)
+        self.depth_to_var.set(nt)
         self.current_depth_from = new_from
         self.current_depth_to = new_to
         
-        self.log_status(f"➡️ Advanced to next segment: {new_from:.2f}m - {new_to:.2f}m")
+        self.log_status(f"➡️ Advanced to next segment: {nf}m - {nt}m")
         
     def on_no_clicked(self):
         """Handle NO button click."""
@@ -416,25 +403,23 @@ class StereoCoreCameraDemo:
         
     def on_plus_clicked(self):
         """Handle + button click."""
-        try:
-            current_to = float(self.depth_to_var.get())
-            new_to = current_to + 0.05
-            self.depth_to_var.set(f"{new_to:.2f}")
-            self.current_depth_to = new_to
-            self.log_status(f"➕ Depth To adjusted to {new_to:.2f}m")
-        except ValueError:
-            messagebox.showerror("Error", "Invalid depth value")
+        new_to = self.current_depth_to + 0.05
+        formatted = f"{new_to:.2f}"
+        # Writing the StringVar dispatches every trace callback and
+        # redraws the Entry, so skip it when the text already matches
+        if self.depth_to_var.get() != formatted:
+            self.depth_to_var.set(formatted)
+        self.current_depth_to = new_to
+        self.log_status(f"➕ Depth To adjusted to {formatted}m")
             
     def on_minus_clicked(self):
         """Handle - button click."""
-        try:
-            current_to = float(self.depth_to_var.get())
-            new_to = max(0, current_to - 0.05)
-            self.depth_to_var.set(f"{new_to:.2f}")
-            self.current_depth_to = new_to
-            self.log_status(f"➖ Depth To adjusted to {new_to:.2f}m")
-        except ValueError:
-            messagebox.showerror("Error", "Invalid depth value")
+        new_to = max(0, self.current_depth_to - 0.05)
+        formatted = f"{new_to:.2f}"
+        if self.depth_to_var.get() != formatted:
+            self.depth_to_var.set(formatted)
+        self.current_depth_to = new_to
+        self.log_status(f"➖ Depth To adjusted to {formatted}m")
             
     def on_brighter_clicked(self):
         """Handle BRIGHTER button click."""
@@ -446,37 +431,82 @@ class StereoCoreCameraDemo:
         
     def on_focus_clicked(self):
         """Handle FOCUS button click."""
-        # Create focus dialog
+        # Build the dialog once; later clicks just remap the window
+        # instead of reallocating half a dozen widgets
+        if self._focus_window is None or not self._focus_window.winfo_exists():
+            self._focus_window = self._build_focus_window()
+        
+        self._focus_window.deiconify()
+        self._focus_window.lift()
+        self._focus_window.grab_set()  # Make it modal
+        
+    def _build_focus_window(self):
+        """Create the focus adjustment dialog."""
         focus_window = tk.Toplevel(self.root)
         focus_window.title("Focus Adjustment")
         focus_window.geometry("300x200")
         focus_window.configure(bg='white')
-        focus_window.grab_set()  # Make it modal
         
         # Center the window
         focus_window.transient(self.root)
         
-        tk.Label(focus_window, text="🎯 Focus Adjustment", font=('Arial', 12, 'bold'), bg='white').pack(pady=20)
+        tk.Label(focus_window, text="🎯 Focus Adjustment", font=self.fonts['body_bold'], bg='white').pack(pady=20)
         tk.Label(focus_window, text="Use + and - to adjust focus\n(Mock Mode)", bg='white').pack()
         
         btn_frame = tk.Frame(focus_window, bg='white')
         btn_frame.pack(pady=20)
         
-        tk.Button(btn_frame, text="+", font=('Arial', 14), width=5, 
+        tk.Button(btn_frame, text="+", font=self.fonts['btn_mid'], width=5, 
                  command=lambda: self.log_status("🎯 Focus adjusted: increase")).pack(side=tk.LEFT, padx=5)
-        tk.Button(btn_frame, text="−", font=('Arial', 14), width=5,
+        tk.Button(btn_frame, text="−", font=self.fonts['btn_mid'], width=5,
                  command=lambda: self.log_status("🎯 Focus adjusted: decrease")).pack(side=tk.LEFT, padx=5)
-        tk.Button(btn_frame, text="OK", font=('Arial', 12), width=8, bg='#4CAF50', fg='white',
-                 command=focus_window.destroy).pack(side=tk.LEFT, padx=10)
+        tk.Button(btn_frame, text="OK", font=self.fonts['body'], width=8, bg='#4CAF50', fg='white',
+                 command=self._hide_focus_window).pack(side=tk.LEFT, padx=10)
+        
+        # Closing via the window manager hides it too, keeping the
+        # widgets alive for the next click
+        focus_window.protocol("WM_DELETE_WINDOW", self._hide_focus_window)
+        focus_window.bind("<Destroy>", self._on_focus_window_destroyed)
+        return focus_window
+        
+    def _hide_focus_window(self):
+        """Release the grab and unmap the focus dialog."""
+        self._focus_window.grab_release()
+        self._focus_window.withdraw()
+        
+    def _on_focus_window_destroyed(self, event):
+        """Forget the cached dialog if Tk tears it down anyway."""
+        if event.widget is self._focus_window:
+            self._focus_window = None
         
     def log_status(self, message):
         """Log status message."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}\n"
+        # strftime stays in C, and rapid lines within the same second
+        # reuse the cached string outright
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+            self._last_ts_sec = now
+        self._log_queue.append(f"[{self._last_ts_str}] {message}\n")
+        
+        # Coalesce bursts into a single insert at the next idle turn
+        # instead of forcing a full event-loop pump per line
+        if not self._log_pending:
+            self._log_pending = True
+            self.root.after_idle(self._flush_log)
+        
+    def _flush_log(self):
+        """Insert all pending log lines in one batch and trim old ones."""
+        self._log_pending = False
+        if not self._log_queue:
+            return
+        batch = ''.join(self._log_queue)
+        self._log_queue.clear()
         
-        self.status_text.insert(tk.END, formatted_message)
+        self.status_text.insert(tk.END, batch)
+        # Resolves to nothing when the widget holds fewer lines
+        self.status_text.delete("1.0", f"end-{_MAX_LOG_LINES}l")
         self.status_text.see(tk.END)
-        self.root.update()
         
     def run(self):
         """Run the demo."""
@@ -4,461 +4,213 @@ Web-based demo for the Stereo Core Camera System.
 Uses Python's built-in HTTP server - works on all platforms!
 """
 
+import email.utils
+import gzip
+import hashlib
 import http.server
-import socketserver
+from http.server import ThreadingHTTPServer
+import socket
+import sys
+import time
 import webbrowser
 import threading
-import time
 from pathlib import Path
 
-HTML_CONTENT = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Stereo Core Camera System - Demo</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-        }
-        .container {
-            max-width: 1000px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-            overflow: hidden;
-        }
-        .header {
-            background: linear-gradient(45deg, #2c3e50, #34495e);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }
-        .header h1 {
-            margin: 0;
-            font-size: 2.5em;
-            font-weight: 300;
-        }
-        .header p {
-            margin: 10px 0 0 0;
-            opacity: 0.8;
-            font-size: 1.1em;
-        }
-        .content {
-            padding: 30px;
-        }
-        .section {
-            background: #f8f9fa;
-            border-radius: 10px;
-            padding: 25px;
-            margin-bottom: 25px;
-            border-left: 5px solid #3498db;
-        }
-        .section h2 {
-            margin-top: 0;
-            color: #2c3e50;
-            font-size: 1.5em;
-        }
-        .input-group {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 20px;
-            margin-bottom: 20px;
-        }
-        .input-field {
-            display: flex;
-            flex-direction: column;
-        }
-        .input-field label {
-            font-weight: bold;
-            margin-bottom: 8px;
-            color: #555;
-        }
-        .input-field input {
-            padding: 12px;
-            border: 2px solid #ddd;
-            border-radius: 8px;
-            font-size: 16px;
-            transition: border-color 0.3s;
-        }
-        .input-field input:focus {
-            outline: none;
-            border-color: #3498db;
-        }
-        .preview-area {
-            background: #2a2a2a;
-            color: white;
-            padding: 40px;
-            text-align: center;
-            border-radius: 10px;
-            margin: 20px 0;
-        }
-        .preview-area h3 {
-            margin-top: 0;
-            font-size: 1.8em;
-        }
-        .camera-specs {
-            background: #34495e;
-            padding: 20px;
-            border-radius: 8px;
-            margin-top: 20px;
-        }
-        .controls {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 15px;
-            margin-top: 25px;
-        }
-        .btn {
-            padding: 15px 25px;
-            border: none;
-            border-radius: 8px;
-            font-size: 16px;
-            font-weight: bold;
-            cursor: pointer;
-            transition: all 0.3s;
-            text-transform: uppercase;
-        }
-        .btn-ok {
-            background: #27ae60;
-            color: white;
-        }
-        .btn-ok:hover {
-            background: #229954;
-            transform: translateY(-2px);
-        }
-        .btn-no {
-            background: #e74c3c;
-            color: white;
-        }
-        .btn-no:hover {
-            background: #c0392b;
-            transform: translateY(-2px);
-        }
-        .btn-adjust {
-            background: #f39c12;
-            color: white;
-        }
-        .btn-adjust:hover {
-            background: #e67e22;
-            transform: translateY(-2px);
-        }
-        .btn-exposure {
-            background: #8e44ad;
-            color: white;
-        }
-        .btn-exposure:hover {
-            background: #7d3c98;
-            transform: translateY(-2px);
-        }
-        .btn-focus {
-            background: #2980b9;
-            color: white;
-        }
-        .btn-focus:hover {
-            background: #1f618d;
-            transform: translateY(-2px);
-        }
-        .status-log {
-            background: #2c3e50;
-            color: #ecf0f1;
-            padding: 20px;
-            border-radius: 8px;
-            font-family: 'Courier New', monospace;
-            max-height: 200px;
-            overflow-y: auto;
-            margin-top: 20px;
-        }
-        .specs-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-top: 25px;
-        }
-        .spec-card {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        .spec-card h4 {
-            margin-top: 0;
-            color: #2c3e50;
-        }
-        .spec-card .value {
-            font-size: 1.5em;
-            font-weight: bold;
-            color: #3498db;
-        }
-        @media (max-width: 768px) {
-            .input-group {
-                grid-template-columns: 1fr;
-            }
-            .controls {
-                grid-template-columns: 1fr 1fr;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🎥 Stereo Core Camera System</h1>
-            <p>Professional Geological Core Photography System</p>
-        </div>
-        
-        <div class="content">
-            <!-- Project Information -->
-            <div class="section">
-                <h2>📋 Project Information</h2>
-                <div class="input-group">
-                    <div class="input-field">
-                        <label for="project">Project Name:</label>
-                        <input type="text" id="project" value="TestProject" placeholder="Enter project name...">
-                    </div>
-                    <div class="input-field">
-                        <label for="borehole">Borehole Name:</label>
-                        <input type="text" id="borehole" value="BH-001" placeholder="Enter borehole name...">
-                    </div>
-                </div>
-                <div class="input-group">
-                    <div class="input-field">
-                        <label for="depth-from">Depth From (m):</label>
-                        <input type="number" id="depth-from" value="0.00" step="0.01">
-                    </div>
-                    <div class="input-field">
-                        <label for="depth-to">Depth To (m):</label>
-                        <input type="number" id="depth-to" value="0.50" step="0.01">
-                    </div>
-                </div>
-            </div>
-
-            <!-- Camera Preview -->
-            <div class="section">
-                <h2>📷 Camera Preview</h2>
-                <div class="preview-area">
-                    <h3>Dual IMX219 Stereo Camera Feed</h3>
-                    <p>🎬 Live Preview Area</p>
-                    <p>This would show real-time stereo camera feeds from both cameras</p>
-                    <div class="camera-specs">
-                        <strong>Camera Specifications:</strong><br>
-                        Resolution: 3280×2464 pixels<br>
-                        Sensor: Sony IMX219<br>
-                        Format: JPEG<br>
-                        Configuration: Stereo Pair
-                    </div>
-                </div>
-            </div>
-
-            <!-- Controls -->
-            <div class="section">
-                <h2>🎮 Controls</h2>
-                <div class="controls">
-                    <button class="btn btn-ok" onclick="captureImages()">✅ OK</button>
-                    <button class="btn btn-no" onclick="rejectCapture()">❌ NO</button>
-                    <button class="btn btn-adjust" onclick="adjustDepth('plus')">➕ Plus</button>
-                    <button class="btn btn-adjust" onclick="adjustDepth('minus')">➖ Minus</button>
-                    <button class="btn btn-exposure" onclick="adjustExposure('brighter')">🔆 Brighter</button>
-                    <button class="btn btn-exposure" onclick="adjustExposure('darker')">🔅 Darker</button>
-                    <button class="btn btn-focus" onclick="openFocusDialog()">🎯 Focus</button>
-                </div>
-            </div>
-
-            <!-- System Status -->
-            <div class="section">
-                <h2>📊 System Status</h2>
-                <div class="specs-grid">
-                    <div class="spec-card">
-                        <h4>Storage Space</h4>
-                        <div class="value">87%</div>
-                        <p>Available</p>
-                    </div>
-                    <div class="spec-card">
-                        <h4>Images Captured</h4>
-                        <div class="value" id="image-count">0</div>
-                        <p>This Session</p>
-                    </div>
-                    <div class="spec-card">
-                        <h4>Current Segment</h4>
-                        <div class="value" id="current-segment">0.00-0.50m</div>
-                        <p>Depth Range</p>
-                    </div>
-                    <div class="spec-card">
-                        <h4>System Status</h4>
-                        <div class="value">✅ Ready</div>
-                        <p>All Systems</p>
-                    </div>
-                </div>
-                
-                <div class="status-log" id="status-log">
-                    <div>🎬 Web Demo started - Mock mode</div>
-                    <div>📷 Camera system initialized</div>
-                    <div>💾 Storage system ready</div>
-                    <div>✅ All systems operational</div>
-                    <div>🔧 Ready for capture operations</div>
-                </div>
-            </div>
-
-            <!-- Hardware Information -->
-            <div class="section">
-                <h2>🔧 Hardware Specifications</h2>
-                <div class="specs-grid">
-                    <div class="spec-card">
-                        <h4>Processor</h4>
-                        <div class="value">RPi 5</div>
-                        <p>4GB RAM</p>
-                    </div>
-                    <div class="spec-card">
-                        <h4>Cameras</h4>
-                        <div class="value">2×IMX219</div>
-                        <p>8MP Each</p>
-                    </div>
-                    <div class="spec-card">
-                        <h4>Display</h4>
-                        <div class="value">5"</div>
-                        <p>HDMI Touch</p>
-                    </div>
-                    <div class="spec-card">
-                        <h4>Core Length</h4>
-                        <div class="value">3.4m</div>
-                        <p>Frame System</p>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        let imageCount = 0;
-        let currentDepthFrom = 0.00;
-        let currentDepthTo = 0.50;
-
-        function logStatus(message) {
-            const log = document.getElementById('status-log');
-            const timestamp = new Date().toLocaleTimeString();
-            log.innerHTML += `<div>[${timestamp}] ${message}</div>`;
-            log.scrollTop = log.scrollHeight;
-        }
-
-        function captureImages() {
-            logStatus('🎬 Starting capture sequence...');
-            setTimeout(() => {
-                logStatus('📷 Camera 1: Image captured');
-                setTimeout(() => {
-                    logStatus('📷 Camera 2: Image captured');
-                    setTimeout(() => {
-                        imageCount += 2;
-                        document.getElementById('image-count').textContent = imageCount;
-                        
-                        // Advance depth
-                        currentDepthFrom = currentDepthTo;
-                        currentDepthTo += 0.5;
-                        
-                        document.getElementById('depth-from').value = currentDepthFrom.toFixed(2);
-                        document.getElementById('depth-to').value = currentDepthTo.toFixed(2);
-                        document.getElementById('current-segment').textContent = 
-                            `${currentDepthFrom.toFixed(2)}-${currentDepthTo.toFixed(2)}m`;
-                        
-                        logStatus(`💾 Images saved: Project/BH-001/BH-001-${currentDepthFrom.toFixed(2)}-${(currentDepthFrom + 0.5).toFixed(2)}-C.jpg`);
-                        logStatus(`✅ Capture complete! Advanced to next segment.`);
-                    }, 800);
-                }, 800);
-            }, 500);
-        }
-
-        function rejectCapture() {
-            logStatus('❌ Capture rejected - ready for retry');
-        }
-
-        function adjustDepth(direction) {
-            const step = 0.05;
-            if (direction === 'plus') {
-                currentDepthFrom += step;
-                currentDepthTo += step;
-                logStatus(`➕ Depth adjusted: +${step}m`);
-            } else {
-                currentDepthFrom -= step;
-                currentDepthTo -= step;
-                logStatus(`➖ Depth adjusted: -${step}m`);
-            }
-            
-            document.getElementById('depth-from').value = currentDepthFrom.toFixed(2);
-            document.getElementById('depth-to').value = currentDepthTo.toFixed(2);
-            document.getElementById('current-segment').textContent = 
-                `${currentDepthFrom.toFixed(2)}-${currentDepthTo.toFixed(2)}m`;
-        }
-
-        function adjustExposure(direction) {
-            if (direction === 'brighter') {
-                logStatus('🔆 Exposure increased');
-            } else {
-                logStatus('🔅 Exposure decreased');
-            }
-        }
-
-        function openFocusDialog() {
-            logStatus('🎯 Focus adjustment mode activated');
-            alert('Focus Adjustment\\n\\nUse the +/- buttons to adjust focus.\\nMonitor the preview for optimal sharpness.\\nClick OK when satisfied.');
-            logStatus('🎯 Focus adjustment complete');
-        }
-
-        // Update project info on change
-        document.getElementById('project').addEventListener('input', function() {
-            logStatus(`📝 Project updated: ${this.value}`);
-        });
-
-        document.getElementById('borehole').addEventListener('input', function() {
-            logStatus(`📝 Borehole updated: ${this.value}`);
-        });
-    </script>
-</body>
-</html>'''
+try:
+    import brotli
+except ImportError:
+    # gzip alone still covers effectively every browser
+    brotli = None
+
+def _minify(html):
+    """Strip indentation, blank lines and comment-only lines.
+
+    Deliberately conservative: newlines are kept so the inline CSS and
+    JavaScript parse exactly as before, and only whole-line HTML
+    comments are dropped. Real minifiers would shave a little more but
+    aren't worth a dependency for a demo page.
+    """
+    kept = []
+    for line in html.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith('<!--') and line.endswith('-->'):
+            continue
+        kept.append(line)
+    return '\n'.join(kept)
+
+
+# The page lives beside this script; reading it once at import beats
+# making the interpreter parse a 15 KB string literal on every start
+HTML_CONTENT = _minify(Path(__file__).with_name('demo.html').read_text(encoding='utf-8'))
+
+# Set once the server socket is listening, so the browser opens as
+# soon as a connection can actually succeed
+SERVER_READY = threading.Event()
+
+# Resolve the browser controller once at import: webbrowser.get() does
+# $BROWSER parsing and PATH lookups we don't want on the launch path
+try:
+    _BROWSER = webbrowser.get()
+except webbrowser.Error:
+    _BROWSER = None  # Headless box; open_browser becomes a no-op
+
+# Encoded once at import; re-encoding ~10 KB of UTF-8 per request is
+# pure wasted CPU for a constant page
+HTML_BYTES = HTML_CONTENT.encode('utf-8')
+HTML_LEN = str(len(HTML_BYTES))
+
+# Compress once, serve many: the page is static, so paying the
+# compressor at import shrinks every response ~5x for free
+HTML_GZIP = gzip.compress(HTML_BYTES, compresslevel=9)
+HTML_BR = brotli.compress(HTML_BYTES, quality=11) if brotli else None
+HTML_ETAG = '"' + hashlib.sha1(HTML_BYTES).hexdigest() + '"'
+
+
+def _pick_encoding(accept_encoding):
+    """Return the response variant key for an Accept-Encoding header."""
+    if HTML_BR is not None and 'br' in accept_encoding:
+        return 'br'
+    if 'gzip' in accept_encoding:
+        return 'gzip'
+    return None
+
+
+def _head_block(body, encoding):
+    """Build the static header block for one precompressed variant."""
+    lines = ['Content-Type: text/html; charset=utf-8']
+    if encoding:
+        lines.append('Content-Encoding: ' + encoding)
+    lines += [
+        'Content-Length: ' + str(len(body)),
+        'Vary: Accept-Encoding',
+        'ETag: ' + HTML_ETAG,
+        'Cache-Control: public, max-age=3600',
+    ]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+
+# Everything but the status line and Date header is knowable at
+# import, so each variant's full head is prebuilt and a response is a
+# single buffered write instead of a dozen send_header pokes
+_RESPONSES = {
+    enc: (body, _head_block(body, enc))
+    for enc, body in (('br', HTML_BR), ('gzip', HTML_GZIP), (None, HTML_BYTES))
+    if body is not None
+}
+_HEAD_304 = ('ETag: ' + HTML_ETAG + '\r\n\r\n').encode('latin-1')
+
+# Date header cached per second: formatdate is surprisingly costly to
+# run per request and HTTP only carries one-second resolution anyway
+_DATE_CACHE = [0.0, b'']
+
+
+def _date_header():
+    now = time.time()
+    if now - _DATE_CACHE[0] > 1.0:
+        _DATE_CACHE[0] = now
+        _DATE_CACHE[1] = (b'Date: '
+                          + email.utils.formatdate(now, usegmt=True).encode('latin-1')
+                          + b'\r\n')
+    return _DATE_CACHE[1]
 
 class DemoHandler(http.server.SimpleHTTPRequestHandler):
+    # HTTP/1.0 closes the socket after every response, so the page,
+    # the favicon probe and each reload paid a fresh TCP handshake;
+    # with 1.1 and the always-present Content-Length the connection
+    # stays open and is reused
+    protocol_version = 'HTTP/1.1'
+    
+    def log_message(self, format, *args):
+        # The default handler formats and writes a line to stderr per
+        # request — a blocking, lock-guarded write on the hot path that
+        # says nothing useful for a single-page demo
+        pass
+    
+    def _respond(self, include_body):
+        """Write the whole response — status, head and body — at once."""
+        version = self.protocol_version.encode('latin-1')
+        date = _date_header()
+        
+        # Warm reloads answer from the browser cache: a 304 is ~50
+        # bytes against the full body
+        if self.headers.get('If-None-Match') == HTML_ETAG:
+            self.wfile.write(version + b' 304 Not Modified\r\n' + date + _HEAD_304)
+            return
+        
+        encoding = _pick_encoding(self.headers.get('Accept-Encoding', ''))
+        body, head = _RESPONSES[encoding]
+        response = version + b' 200 OK\r\n' + date + head
+        if include_body:
+            response += body
+        self.wfile.write(response)
+    
     def do_GET(self):
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(HTML_CONTENT.encode())
+        self._respond(include_body=True)
+    
+    def do_HEAD(self):
+        self._respond(include_body=False)
+
+class ReusableServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer tuned for quick restarts and burst connects."""
+    
+    # Rebind immediately after a restart instead of waiting out TIME_WAIT
+    allow_reuse_address = True
+    # Default listen backlog is tiny; let the kernel absorb connect
+    # bursts rather than dropping SYNs
+    request_queue_size = 128
+    
+    def server_bind(self):
+        if hasattr(socket, 'SO_REUSEPORT'):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+# Startup banner, joined once so main() issues a single stdout write
+# instead of ~15 line-buffered prints
+BANNER = "\n".join([
+    "✅ Demo server running!",
+    "🔧 Demo Features:",
+    "   • Complete UI layout preview",
+    "   • Interactive controls",
+    "   • Mock capture workflow",
+    "   • Real-time status updates",
+    "   • Responsive design",
+    "",
+    "🎯 Try the workflow:",
+    "   1. Modify project information",
+    "   2. Click OK to simulate capture",
+    "   3. Watch automatic depth advancement",
+    "   4. Test all control buttons",
+    "",
+    "⏹️  Press Ctrl+C to stop the demo",
+]) + "\n"
+
 
 def open_browser():
-    time.sleep(1)
-    webbrowser.open('http://localhost:8080')
+    SERVER_READY.wait(timeout=5)
+    if _BROWSER is not None:
+        _BROWSER.open('http://localhost:8080', new=2)
 
 def main():
     PORT = 8080
     
-    print("🎬 Starting Stereo Core Camera Web Demo...")
-    print(f"🌐 Server starting on http://localhost:{PORT}")
+    sys.stdout.write("🎬 Starting Stereo Core Camera Web Demo...\n"
+                     f"🌐 Server starting on http://localhost:{PORT}\n")
     
     # Start browser in a separate thread
     browser_thread = threading.Thread(target=open_browser)
     browser_thread.daemon = True
     browser_thread.start()
     
-    # Start server
-    with socketserver.TCPServer(("", PORT), DemoHandler) as httpd:
-        print("✅ Demo server running!")
-        print("🔧 Demo Features:")
-        print("   • Complete UI layout preview")
-        print("   • Interactive controls")
-        print("   • Mock capture workflow")
-        print("   • Real-time status updates")
-        print("   • Responsive design")
-        print("")
-        print("🎯 Try the workflow:")
-        print("   1. Modify project information")
-        print("   2. Click OK to simulate capture")
-        print("   3. Watch automatic depth advancement")
-        print("   4. Test all control buttons")
-        print("")
-        print("⏹️  Press Ctrl+C to stop the demo")
+    # Start server; one short-lived thread per connection so a slow
+    # client can't stall everyone else behind it
+    with ReusableServer(("", PORT), DemoHandler) as httpd:
+        httpd.daemon_threads = True
+        SERVER_READY.set()
+        sys.stdout.write(BANNER)
+        sys.stdout.flush()
         
         try:
             httpd.serve_forever()